@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import User
+
+
+async def user_etag(request: Request, session: AsyncSession, user_id: str, scope: str) -> str:
+    """Weak ETag for ``scope`` derived from the user's data version and the request URL.
+
+    Costs a single primary-key lookup, so it can be answered before the real query runs.
+    """
+    version = await session.scalar(select(User.data_version).where(User.id == user_id))
+    digest = hashlib.sha1(f"{user_id}:{scope}:{request.url.path}?{request.url.query}".encode("utf-8")).hexdigest()[:16]
+    return f'W/"{digest}-{version or 0}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """Attach ``etag`` to the response, or return a 304 if the client already has it."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    candidates = {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+import anyio
+from fastapi import HTTPException, Request
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_ZERO_COPY = "http.response.zerocopysend"
+CHUNK_SIZE = 256 * 1024
+
+
+class FileRangeResponse(Response):
+    """Serve ``path`` (or one byte range of it) without loading it into memory.
+
+    Uses the ASGI zero-copy send extension (``sendfile``) when the server offers
+    it and falls back to chunked reads otherwise.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        filename: str,
+        media_type: str,
+        byte_range: Optional[tuple[int, int]] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        size = path.stat().st_size
+        self.path = path
+        self.offset, end = byte_range if byte_range is not None else (0, size - 1)
+        self.count = max(end - self.offset + 1, 0)
+        self.status_code = 206 if byte_range is not None else 200
+        self.media_type = media_type
+        self.background = background
+        self.body = b""
+        self.init_headers(
+            {
+                "Content-Length": str(self.count),
+                "Accept-Ranges": "bytes",
+                "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}",
+            }
+        )
+        if byte_range is not None:
+            self.headers["Content-Range"] = f"bytes {self.offset}-{end}/{size}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope.get("method") == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+        elif _ZERO_COPY in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send({"type": _ZERO_COPY, "file": file, "offset": self.offset, "count": self.count})
+        else:
+            await self._send_chunks(send)
+        if self.background is not None:
+            await self.background()
+
+    async def _send_chunks(self, send: Send) -> None:
+        remaining = self.count
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.offset, os.SEEK_SET)
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Resolve a single ``bytes=start-end`` range; multi-range requests get the whole file."""
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if start:
+        first, last = int(start), min(int(end), size - 1) if end else size - 1
+    else:
+        first, last = max(size - int(end), 0), size - 1
+    if first > last or first >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable.",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return first, last
+
+
+def file_response(request: Request, path: Path, filename: str, media_type: str) -> FileRangeResponse:
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="File not found.")
+    byte_range = parse_range(request.headers.get("range"), path.stat().st_size)
+    return FileRangeResponse(path, filename, media_type, byte_range)
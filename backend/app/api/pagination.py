@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import ColumnElement, Select
+
+T = TypeVar("T")
+S = TypeVar("S", bound=Select)
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass
+class PageParams:
+    limit: int
+    cursor: Optional[tuple[datetime, str]]
+
+
+def page_params(
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description=f"Page size; defaults to {DEFAULT_PAGE_SIZE} when a cursor is given.",
+    ),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header."),
+) -> Optional[PageParams]:
+    """``None`` (no ``limit`` or ``cursor``) keeps the unpaginated listing older clients expect."""
+    if limit is None and cursor is None:
+        return None
+    return PageParams(limit=limit or DEFAULT_PAGE_SIZE, cursor=decode_cursor(cursor) if cursor else None)
+
+
+def encode_cursor(timestamp: datetime, row_id: str) -> str:
+    raw = json.dumps([timestamp.isoformat(), row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, row_id = json.loads(raw)
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor.") from exc
+
+
+def after_cursor(timestamp_column: Any, id_column: Any, page: PageParams) -> Optional[ColumnElement]:
+    """Keyset condition for rows after the cursor when ordering by (timestamp, id) descending."""
+    if page.cursor is None:
+        return None
+    timestamp, row_id = page.cursor
+    return or_(
+        timestamp_column < timestamp,
+        and_(timestamp_column == timestamp, id_column < row_id),
+    )
+
+
+def paginate(stmt: S, timestamp_column: Any, id_column: Any, page: Optional[PageParams]) -> S:
+    """Apply the cursor and a ``limit + 1`` look-ahead; an unpaginated request is left alone."""
+    if page is None:
+        return stmt
+    cursor_filter = after_cursor(timestamp_column, id_column, page)
+    if cursor_filter is not None:
+        stmt = stmt.where(cursor_filter)
+    return stmt.limit(page.limit + 1)
+
+
+def finish_page(
+    response: Response,
+    rows: Sequence[T],
+    page: Optional[PageParams],
+    key: Callable[[T], tuple[datetime, str]],
+) -> Sequence[T]:
+    """Trim the look-ahead row fetched with ``limit + 1`` and advertise the next cursor."""
+    if page is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(rows[-1]))
+    return rows
+
+
+def parse_fields(fields: Optional[str], allowed: set[str]) -> set[str]:
+    """Resolve a ``fields=a,b`` projection; no parameter means every field."""
+    if fields is None:
+        return set(allowed)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return requested
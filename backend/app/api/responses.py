@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def json_response(
+    schema: Any,
+    value: Any,
+    response: Response | None = None,
+    *,
+    status_code: int = 200,
+    exclude_unset: bool = False,
+) -> Response:
+    """Serialize ``value`` as ``schema`` straight to JSON bytes.
+
+    Returning a ``Response`` skips FastAPI's second validation pass against
+    ``response_model``. Values built with ``model_construct`` from rows the app
+    wrote itself are dumped without re-parsing their URLs. Headers already set
+    on the injected ``response`` (ETag, pagination cursor) are carried over.
+    """
+    body = _adapter(schema).dump_json(value, exclude_unset=exclude_unset, warnings=False)
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=_carried_headers(response),
+    )
+
+
+def stream_json_array(
+    item_schema: Any,
+    items: Iterable[Any],
+    response: Response | None = None,
+    *,
+    status_code: int = 200,
+    exclude_unset: bool = False,
+    chunk_size: int = 25,
+) -> StreamingResponse:
+    """Stream ``items`` as a JSON array, serializing ``chunk_size`` items at a time.
+
+    The first chunk goes out while later items are still being built and
+    encoded, and the full body is never held in memory at once.
+
+    The first chunk is encoded before this returns, so a failure there becomes a
+    normal error response. A failure after the status line has gone out is logged
+    and re-raised. The server then drops the connection without ending the
+    chunked body, so clients see an incomplete response instead of a
+    well-formed but truncated array.
+    """
+    adapter = _adapter(item_schema)
+    iterator = iter(items)
+
+    def _encode(batch: list) -> bytes:
+        return b",".join(adapter.dump_json(item, exclude_unset=exclude_unset, warnings=False) for item in batch)
+
+    first = list(islice(iterator, chunk_size))
+    head = b"[" + _encode(first) if first else b"["
+
+    def _chunks() -> Iterator[bytes]:
+        yield head
+        try:
+            while batch := list(islice(iterator, chunk_size)):
+                yield b"," + _encode(batch)
+        except Exception:
+            logger.exception("JSON array stream failed mid-response; aborting the connection.")
+            raise
+        yield b"]"
+
+    return StreamingResponse(
+        _chunks(),
+        status_code=status_code,
+        media_type="application/json",
+        headers=_carried_headers(response),
+    )
+
+
+def _carried_headers(response: Response | None) -> dict[str, str]:
+    if response is None:
+        return {}
+    return {key: header for key, header in response.headers.items() if key != "content-length"}
@@ -1,3 +1,3 @@
-from . import auth, dashboard, jobs, resumes, tailoring
+from . import auth, dashboard, health, jobs, resumes, tailoring
 
-__all__ = ["auth", "dashboard", "jobs", "resumes", "tailoring"]
+__all__ = ["auth", "dashboard", "health", "jobs", "resumes", "tailoring"]
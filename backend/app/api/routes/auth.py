@@ -4,21 +4,24 @@ from datetime import datetime, timezone
 
 from urllib.parse import urlencode
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.security import create_access_token, get_current_user
+from app.core.security import create_access_token, get_current_user, invalidate_cached_user
 from app.db.session import get_session
 from app.models.models import User
 from app.schemas import AuthResponse, GoogleAuthURLResponse, Token, UserRead
 from app.services.google import (
-    credentials_from_tokens,
+    GoogleOAuthError,
     exchange_code_for_tokens,
     fetch_google_profile,
     generate_google_auth_url,
+    profile_from_id_token,
 )
+from app.services.google_credentials import credential_manager
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -34,8 +37,12 @@ async def google_callback(
     state: str | None = None,
     session: AsyncSession = Depends(get_session),
 ):
-    creds = exchange_code_for_tokens(code)
-    profile = await fetch_google_profile(creds.token)
+    try:
+        creds = await exchange_code_for_tokens(code)
+        # The ID token already carries the profile; only fall back to userinfo without it.
+        profile = profile_from_id_token(creds.id_token) or await fetch_google_profile(creds.token)
+    except (httpx.HTTPError, ValueError, GoogleOAuthError) as exc:
+        raise HTTPException(status_code=400, detail="Google sign-in failed; please try again.") from exc
 
     email = profile.get("email")
     if not email:
@@ -87,4 +94,6 @@ async def _get_or_create_user(session: AsyncSession, profile: dict, creds) -> Us
 
     await session.commit()
     await session.refresh(user)
+    invalidate_cached_user(user.id)
+    credential_manager.forget(user.id)
     return user
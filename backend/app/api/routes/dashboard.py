@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import Row, and_, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
+from app.api.etag import not_modified, user_etag
+from app.api.responses import stream_json_array
+from app.api.pagination import PageParams, finish_page, page_params, paginate
 from app.core.security import get_current_user
+from app.db.routing import get_read_session
 from app.db.session import get_session
 from app.models.models import (
     ApplicationStatus,
@@ -18,7 +22,10 @@ from app.models.models import (
     JobSearchHistory,
     ResumeTailoring,
     User,
+    UserStatusSeries,
 )
+from app.services import rollups, status_history
+from app.services.scores import best_scores
 from app.schemas import (
     ApplicationRecord,
     ApplicationCreateRequest,
@@ -31,55 +38,47 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 @router.get("/summary", response_model=DashboardSummary)
 async def dashboard_summary(
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_user),
 ) -> DashboardSummary:
-    statuses = await _fetch_statuses(session, current_user.id)
-    counts = defaultdict(int)
-    for status in statuses:
-        counts[status.status] += 1
+    etag = await user_etag(request, session, current_user.id, "dashboard-summary")
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
 
-    weekly_data = _aggregate_weekly(statuses)
-    status_over_time = _status_over_time(statuses)
+    counts = await rollups.status_counts(session, current_user.id)
+    series = await session.get(UserStatusSeries, current_user.id)
 
     return DashboardSummary(
-        total_jobs=len(statuses),
-        applied=counts[ApplicationStatusEnum.APPLIED],
-        interviews=counts[ApplicationStatusEnum.INTERVIEW],
-        offers=counts[ApplicationStatusEnum.OFFER],
-        rejections=counts[ApplicationStatusEnum.REJECTED],
-        weekly_applications=weekly_data,
-        status_over_time=status_over_time,
+        total_jobs=sum(counts.values()),
+        applied=counts.get(ApplicationStatusEnum.APPLIED.value, 0),
+        interviews=counts.get(ApplicationStatusEnum.INTERVIEW.value, 0),
+        offers=counts.get(ApplicationStatusEnum.OFFER.value, 0),
+        rejections=counts.get(ApplicationStatusEnum.REJECTED.value, 0),
+        weekly_applications=await rollups.weekly_counts(session, current_user.id),
+        status_over_time=status_history.series_points(series.daily if series else None, "date"),
+        status_over_time_weekly=status_history.series_points(series.weekly if series else None, "week"),
     )
 
 
 @router.get("/applications", response_model=list[ApplicationRecord])
 async def list_applications(
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    response: Response,
+    page: PageParams | None = Depends(page_params),
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_user),
 ) -> list[ApplicationRecord]:
-    statuses = await _fetch_statuses(session, current_user.id)
-    records: list[ApplicationRecord] = []
-    for status in statuses:
-        job = status.job_posting
-        if not job:
-            continue
-        resume_url = await _latest_tailoring_url(session, current_user.id, job.id, "resume")
-        cover_url = await _latest_tailoring_url(session, current_user.id, job.id, "cover_letter")
-        records.append(
-            ApplicationRecord(
-                job_id=job.id,
-                job_title=job.title,
-                company=job.company,
-                status=status.status,
-                match_score=job.match_score,
-                application_link=job.application_link or job.url,
-                tailored_resume_url=resume_url,
-                tailored_cover_letter_url=cover_url,
-                updated_at=status.updated_at,
-            )
-        )
-    return records
+    etag = await user_etag(request, session, current_user.id, "dashboard-applications")
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    rows = await _application_rows(session, current_user.id, page=page)
+    rows = finish_page(response, rows, page, key=lambda row: (row.updated_at, row.id))
+    return stream_json_array(ApplicationRecord, (_application_record(row) for row in rows), response)
 
 
 @router.post("/applications", response_model=ApplicationRecord, status_code=201)
@@ -98,14 +97,6 @@ async def create_application(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
 
-    existing_stmt = select(ApplicationStatus).where(
-        ApplicationStatus.user_id == current_user.id,
-        ApplicationStatus.job_id == payload.job_id,
-    )
-    existing_result = await session.execute(existing_stmt)
-    if existing_result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Job already tracked.")
-
     status_entry = ApplicationStatus(
         user_id=current_user.id,
         job_id=payload.job_id,
@@ -113,24 +104,14 @@ async def create_application(
         notes=payload.notes,
         applied_at=payload.applied_at,
     )
-    session.add(status_entry)
+    if not await _add_application(session, status_entry):
+        raise HTTPException(status_code=400, detail="Job already tracked.")
+    await rollups.apply_status_change(session, current_user.id, None, rollups.status_bucket(status_entry))
+    await status_history.record_transition(session, current_user.id, job.id, None, status_entry.status)
     await session.commit()
-    await session.refresh(status_entry)
-
-    resume_url = await _latest_tailoring_url(session, current_user.id, job.id, "resume")
-    cover_url = await _latest_tailoring_url(session, current_user.id, job.id, "cover_letter")
-
-    return ApplicationRecord(
-        job_id=job.id,
-        job_title=job.title,
-        company=job.company,
-        status=status_entry.status,
-        match_score=job.match_score,
-        application_link=job.application_link or job.url,
-        tailored_resume_url=resume_url,
-        tailored_cover_letter_url=cover_url,
-        updated_at=status_entry.updated_at,
-    )
+
+    rows = await _application_rows(session, current_user.id, job_id=job.id)
+    return _application_record(rows[0], validate=True)
 
 
 @router.post("/applications/status", response_model=ApplicationRecord)
@@ -143,45 +124,36 @@ async def update_application_status(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
 
-    result = await session.execute(
-        select(ApplicationStatus).where(
-            ApplicationStatus.user_id == current_user.id,
-            ApplicationStatus.job_id == job.id,
-        )
-    )
-    status_entry = result.scalar_one_or_none()
-    if status_entry:
-        status_entry.status = payload.status
-        status_entry.notes = payload.notes
-        status_entry.applied_at = payload.applied_at
-        status_entry.updated_at = datetime.utcnow()
-    else:
-        status_entry = ApplicationStatus(
+    created = None
+    status_entry = await _locked_application(session, current_user.id, job.id)
+    if status_entry is None:
+        created = ApplicationStatus(
             user_id=current_user.id,
             job_id=job.id,
             status=payload.status,
             notes=payload.notes,
             applied_at=payload.applied_at,
         )
-        session.add(status_entry)
+        if await _add_application(session, created):
+            status_entry = created
+        else:
+            # A concurrent request tracked the job first; update its row instead.
+            status_entry = await _locked_application(session, current_user.id, job.id)
+    before = before_status = None
+    if status_entry is not created:
+        before = rollups.status_bucket(status_entry)
+        before_status = status_entry.status
+        status_entry.status = payload.status
+        status_entry.notes = payload.notes
+        status_entry.applied_at = payload.applied_at
+        status_entry.updated_at = datetime.utcnow()
 
+    await rollups.apply_status_change(session, current_user.id, before, rollups.status_bucket(status_entry))
+    await status_history.record_transition(session, current_user.id, job.id, before_status, status_entry.status)
     await session.commit()
-    await session.refresh(status_entry)
-
-    resume_url = await _latest_tailoring_url(session, current_user.id, job.id, "resume")
-    cover_url = await _latest_tailoring_url(session, current_user.id, job.id, "cover_letter")
-
-    return ApplicationRecord(
-        job_id=job.id,
-        job_title=job.title,
-        company=job.company,
-        status=status_entry.status,
-        match_score=job.match_score,
-        application_link=job.application_link or job.url,
-        tailored_resume_url=resume_url,
-        tailored_cover_letter_url=cover_url,
-        updated_at=status_entry.updated_at,
-    )
+
+    rows = await _application_rows(session, current_user.id, job_id=job.id)
+    return _application_record(rows[0], validate=True)
 
 
 @router.delete("/applications/{job_id}", status_code=204, response_class=Response)
@@ -200,60 +172,105 @@ async def delete_application(
     if not status_entry:
         raise HTTPException(status_code=404, detail="Application not found.")
 
+    await rollups.apply_status_change(session, current_user.id, rollups.status_bucket(status_entry), None)
+    await status_history.record_transition(session, current_user.id, job_id, status_entry.status, None)
     await session.delete(status_entry)
     await session.commit()
 
 
-async def _fetch_statuses(session: AsyncSession, user_id: str) -> list[ApplicationStatus]:
+async def _locked_application(session: AsyncSession, user_id: str, job_id: str) -> ApplicationStatus | None:
+    """Load an application row locked, so concurrent status changes apply one after another."""
     result = await session.execute(
         select(ApplicationStatus)
-        .where(ApplicationStatus.user_id == user_id)
-        .order_by(ApplicationStatus.updated_at.desc())
-        .options(selectinload(ApplicationStatus.job_posting))
+        .where(ApplicationStatus.user_id == user_id, ApplicationStatus.job_id == job_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
-    return result.scalars().all()
-
-
-def _aggregate_weekly(statuses: list[ApplicationStatus]) -> list[dict]:
-    now = datetime.utcnow()
-    start = now - timedelta(weeks=6)
-    buckets = defaultdict(int)
-
-    for status in statuses:
-        event_date = status.applied_at or status.updated_at
-        if event_date and event_date >= start:
-            week_label = event_date.strftime("%Y-%W")
-            buckets[week_label] += 1
-
-    return [{"week": week, "count": buckets[week]} for week in sorted(buckets.keys())]
+    return result.scalar_one_or_none()
 
 
-def _status_over_time(statuses: list[ApplicationStatus]) -> list[dict]:
-    history = defaultdict(lambda: defaultdict(int))
-    for status in statuses:
-        event_date = (status.applied_at or status.updated_at or datetime.utcnow()).date().isoformat()
-        history[event_date][status.status] += 1
-    output = []
-    for day in sorted(history.keys()):
-        row = {"date": day}
-        row.update(history[day])
-        output.append(row)
-    return output
+async def _add_application(session: AsyncSession, status_entry: ApplicationStatus) -> bool:
+    """Insert ``status_entry`` unless a concurrent request already tracked the job."""
+    try:
+        async with session.begin_nested():
+            session.add(status_entry)
+    except IntegrityError:
+        return False
+    return True
 
 
-async def _latest_tailoring_url(
+async def _application_rows(
     session: AsyncSession,
     user_id: str,
-    job_id: str,
-    kind: str,
-) -> str | None:
+    job_id: str | None = None,
+    page: PageParams | None = None,
+) -> list[Row]:
+    """Fetch applications with their posting and latest tailoring's Drive links in one query."""
+    tailorings = (
+        select(
+            ResumeTailoring.job_id,
+            ResumeTailoring.drive_resume_url,
+            ResumeTailoring.drive_coverletter_url,
+            func.row_number()
+            .over(partition_by=ResumeTailoring.job_id, order_by=ResumeTailoring.updated_at.desc())
+            .label("recency"),
+        )
+        .where(ResumeTailoring.user_id == user_id)
+    )
+    if job_id is not None:
+        tailorings = tailorings.where(ResumeTailoring.job_id == job_id)
+    latest_tailoring = tailorings.subquery()
+    best_score = best_scores(user_id, job_id)
+
     stmt = (
-        select(ResumeTailoring)
-        .where(ResumeTailoring.user_id == user_id, ResumeTailoring.job_id == job_id)
-        .order_by(ResumeTailoring.updated_at.desc())
+        select(
+            ApplicationStatus.id,
+            ApplicationStatus.job_id,
+            ApplicationStatus.status,
+            ApplicationStatus.updated_at,
+            JobPosting.title,
+            JobPosting.company,
+            # Postings scored before per-resume scores existed keep their old value.
+            func.coalesce(best_score.c.score, JobPosting.match_score).label("match_score"),
+            JobPosting.application_link,
+            JobPosting.url,
+            latest_tailoring.c.drive_resume_url,
+            latest_tailoring.c.drive_coverletter_url,
+        )
+        .join(JobPosting, JobPosting.id == ApplicationStatus.job_id)
+        .outerjoin(
+            latest_tailoring,
+            and_(
+                latest_tailoring.c.job_id == ApplicationStatus.job_id,
+                latest_tailoring.c.recency == 1,
+            ),
+        )
+        .outerjoin(best_score, best_score.c.job_id == ApplicationStatus.job_id)
+        .where(ApplicationStatus.user_id == user_id)
+        .order_by(ApplicationStatus.updated_at.desc(), ApplicationStatus.id.desc())
     )
+    if job_id is not None:
+        stmt = stmt.where(ApplicationStatus.job_id == job_id)
+    stmt = paginate(stmt, ApplicationStatus.updated_at, ApplicationStatus.id, page)
+
     result = await session.execute(stmt)
-    tailoring = result.scalars().first()
-    if not tailoring:
-        return None
-    return tailoring.drive_resume_url if kind == "resume" else tailoring.drive_coverletter_url
+    return result.all()
+
+
+def _application_record(row: Row, validate: bool = False) -> ApplicationRecord:
+    values = dict(
+        job_id=row.job_id,
+        job_title=row.title,
+        company=row.company,
+        status=ApplicationStatusEnum(row.status),
+        match_score=row.match_score,
+        application_link=row.application_link or row.url,
+        tailored_resume_url=row.drive_resume_url,
+        tailored_cover_letter_url=row.drive_coverletter_url,
+        updated_at=row.updated_at,
+    )
+    if validate:
+        # Single records still go through response_model, which expects parsed URLs.
+        return ApplicationRecord.model_validate(values)
+    # Listings are dumped with warnings off; skip re-parsing URLs from our own tables.
+    return ApplicationRecord.model_construct(**values)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.db.pool import pool_stats
+from app.db.session import engine, replica_engine
+from app.services.export_queue import export_queue
+from app.services.parse_pool import parse_stats
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/db-pool")
+async def db_pool_health() -> dict:
+    stats = {"primary": pool_stats(engine)}
+    if replica_engine is not None:
+        stats["replica"] = pool_stats(replica_engine)
+    return stats
+
+
+@router.get("/parser")
+async def parser_health() -> dict:
+    return parse_stats()
+
+
+@router.get("/exports")
+async def exports_health() -> dict:
+    return export_queue.stats()
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.api.etag import not_modified, user_etag
+from app.api.responses import json_response, stream_json_array
+from app.api.pagination import PageParams, finish_page, page_params, paginate, parse_fields
+from app.core.config import get_settings
 from app.core.security import get_current_user
+from app.db.routing import get_read_session
 from app.db.session import get_session
+from app.db.versioning import bump_data_version
 from app.models.models import JobPosting, JobSearchHistory, ResumeFile, User
 from app.schemas import JobPostingRead, JobScoreRequest, JobScoreResponse, JobSearchRequest
 from app.services.job_search import fetch_job_postings
-from app.services import llm
+from app.services.job_store import READ_COLUMNS, insert_job_postings
+from app.services.scores import lookup_scores, score_key, score_posting, score_version
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+settings = get_settings()
+
 
 @router.post("/search", response_model=list[JobPostingRead])
 async def search_jobs(
@@ -23,16 +30,9 @@ async def search_jobs(
     current_user: User = Depends(get_current_user),
 ) -> list[JobPostingRead]:
     resume_text = None
+    resume = None
     if payload.resume_id:
-        result = await session.execute(
-            select(ResumeFile).where(
-                ResumeFile.id == payload.resume_id,
-                ResumeFile.user_id == current_user.id,
-            )
-        )
-        resume = result.scalar_one_or_none()
-        if not resume:
-            raise HTTPException(status_code=404, detail="Resume not found.")
+        resume = await _get_resume(session, payload.resume_id, current_user.id)
         resume_text = resume.parsed_text
 
     search = JobSearchHistory(user_id=current_user.id, query_parameters=payload.query.model_dump())
@@ -41,81 +41,78 @@ async def search_jobs(
 
     jobs = await fetch_job_postings(payload.query, resume_text)
 
-    db_jobs: list[JobPosting] = []
-    for job in jobs:
-        db_job = JobPosting(
-            search_id=search.id,
-            title=job["title"],
-            company=job["company"],
-            location=job["location"],
-            description=job["description"],
-            snippet=job.get("snippet"),
-            url=job["url"] or job.get("application_link") or "",
-            application_link=job.get("application_link"),
-            match_score=job["match_score"],
-            work_mode=job.get("work_mode"),
-            experience_level=str(job.get("experience_level")) if job.get("experience_level") else None,
-            skills=job.get("skills"),
-            posting_date=job.get("posting_date"),
-            company_logo_url=job.get("company_logo_url"),
-        )
-        session.add(db_job)
-        db_jobs.append(db_job)
-
+    rows = await insert_job_postings(session, search.id, jobs)
     await session.commit()
+    if resume is not None:
+        scores = await lookup_scores(session, score_key(resume), {row["id"]: row["url"] for row in rows})
+        for row in rows:
+            row["match_score"] = scores.get(row["id"])
+
+    # Validated once here; later reads of these rows are built without re-parsing.
+    postings = [JobPostingRead.model_validate({**row, "skills": row["skills"] or []}) for row in rows]
+    return stream_json_array(JobPostingRead, postings)
+
+
+@router.get("/", response_model=list[JobPostingRead], response_model_exclude_unset=True)
+async def list_job_postings(
+    request: Request,
+    response: Response,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return. description is only loaded when listed.",
+    ),
+    resume_id: str | None = Query(None, description="Fill match_score with this resume's stored scores."),
+    page: PageParams | None = Depends(page_params),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_user),
+) -> list[JobPostingRead]:
+    etag = await user_etag(request, session, current_user.id, _etag_scope("jobs", resume_id))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
 
-    return [
-        JobPostingRead(
-            id=db_job.id,
-            title=db_job.title,
-            company=db_job.company,
-            location=db_job.location,
-            description=db_job.description,
-            snippet=db_job.snippet,
-            url=db_job.url,
-            application_link=db_job.application_link,
-            match_score=db_job.match_score,
-            work_mode=db_job.work_mode,
-            experience_level=db_job.experience_level,
-            skills=db_job.skills or [],
-            posting_date=db_job.posting_date,
-            company_logo_url=db_job.company_logo_url,
-        )
-        for db_job in db_jobs
-    ]
+    include_description = "description" in parse_fields(fields, set(JobPostingRead.model_fields))
+    columns = [column for column in READ_COLUMNS if include_description or column.name != "description"]
+    stmt = (
+        select(*columns, JobPosting.created_at)
+        .join(JobSearchHistory, JobPosting.search_id == JobSearchHistory.id)
+        .where(JobSearchHistory.user_id == current_user.id)
+        .order_by(JobPosting.created_at.desc(), JobPosting.id.desc())
+    )
+    stmt = paginate(stmt, JobPosting.created_at, JobPosting.id, page)
+
+    result = await session.execute(stmt)
+    rows = finish_page(response, result.mappings().all(), page, key=lambda row: (row["created_at"], row["id"]))
+    scores = await _resume_scores(session, resume_id, current_user.id, rows)
+    postings = (_posting_read(row, columns, scores) for row in rows)
+    return stream_json_array(JobPostingRead, postings, response, exclude_unset=True)
 
 
 @router.get("/{job_id}", response_model=JobPostingRead)
 async def get_job_detail(
+    request: Request,
+    response: Response,
     job_id: str,
-    session: AsyncSession = Depends(get_session),
+    resume_id: str | None = Query(None, description="Fill match_score with this resume's stored score."),
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_user),
 ) -> JobPostingRead:
+    etag = await user_etag(request, session, current_user.id, _etag_scope("job-detail", resume_id))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     stmt = (
-        select(JobPosting)
+        select(*READ_COLUMNS)
         .join(JobSearchHistory, JobPosting.search_id == JobSearchHistory.id)
         .where(JobPosting.id == job_id, JobSearchHistory.user_id == current_user.id)
     )
     result = await session.execute(stmt)
-    job = result.scalar_one_or_none()
-    if not job:
+    row = result.mappings().one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Job not found.")
-    return JobPostingRead(
-        id=job.id,
-        title=job.title,
-        company=job.company,
-        location=job.location,
-        description=job.description,
-        snippet=job.snippet,
-        url=job.url,
-        application_link=job.application_link,
-        match_score=job.match_score,
-        work_mode=job.work_mode,
-        experience_level=job.experience_level,
-        skills=job.skills or [],
-        posting_date=job.posting_date,
-        company_logo_url=job.company_logo_url,
-    )
+    scores = await _resume_scores(session, resume_id, current_user.id, [row])
+    return json_response(JobPostingRead, _posting_read(row, READ_COLUMNS, scores), response)
 
 
 @router.post("/{job_id}/score", response_model=JobScoreResponse)
@@ -135,18 +132,44 @@ async def score_job_match(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
 
-    resume_stmt = select(ResumeFile).where(
-        ResumeFile.id == payload.resume_id,
-        ResumeFile.user_id == current_user.id,
+    resume = await _get_resume(session, payload.resume_id, current_user.id)
+    score, cached = await score_posting(session, score_key(resume), job)
+    if not cached:
+        # Scores are written with a bare upsert, so bump the ETag version by hand.
+        await session.run_sync(bump_data_version, current_user.id)
+        await session.commit()
+
+    return JobScoreResponse(job_id=job.id, match_score=score)
+
+
+async def _get_resume(session: AsyncSession, resume_id: str, user_id: str) -> ResumeFile:
+    result = await session.execute(
+        select(ResumeFile).where(ResumeFile.id == resume_id, ResumeFile.user_id == user_id)
     )
-    resume_result = await session.execute(resume_stmt)
-    resume = resume_result.scalar_one_or_none()
+    resume = result.scalar_one_or_none()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found.")
+    return resume
 
-    score = await llm.score_job_match(resume.parsed_text, job.description)
-    job.match_score = score
-    job.updated_at = datetime.utcnow()
-    await session.commit()
 
-    return JobScoreResponse(job_id=job.id, match_score=score)
+async def _resume_scores(session: AsyncSession, resume_id: str | None, user_id: str, rows) -> dict[str, float] | None:
+    if resume_id is None:
+        return None
+    resume = await _get_resume(session, resume_id, user_id)
+    return await lookup_scores(session, score_key(resume), {row["id"]: row["url"] for row in rows})
+
+
+def _etag_scope(scope: str, resume_id: str | None) -> str:
+    # Stored scores stop counting when the model or prompt changes, without a data write.
+    if resume_id is None:
+        return scope
+    return f"{scope}:{settings.OLLAMA_MODEL}:{score_version()}"
+
+
+def _posting_read(row, columns, scores: dict[str, float] | None = None) -> JobPostingRead:
+    """Build a posting response from a stored row without re-validating it."""
+    values = {column.name: row[column.name] for column in columns}
+    values["skills"] = values.get("skills") or []
+    if scores is not None:
+        values["match_score"] = scores.get(row["id"])
+    return JobPostingRead.model_construct(**values)
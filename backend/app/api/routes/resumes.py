@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import mimetypes
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, Response
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from sqlmodel import select
 
+from app.api.etag import not_modified, user_etag
+from app.api.files import file_response
+from app.api.responses import json_response
+from app.api.pagination import PageParams, finish_page, page_params, paginate, parse_fields
 from app.core.security import get_current_user
+from app.db.routing import get_read_session
 from app.db.session import get_session
 from app.models.models import ResumeFile, User
 from app.schemas import ResumeUploadResponse
-from app.services.parser import extract_text, save_upload_file
+from app.services.parse_pool import ParserBusyError, ResumeParseError, parse_resume
+from app.services.parser import content_key, save_upload_file
+from app.services.resume_sections import build_index
+from app.services.resume_store import cached_parse, lock_file, release_file, remember_parse
+from app.services.storage import get_storage, resolve
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
@@ -21,14 +33,35 @@ async def upload_resume(
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> ResumeUploadResponse:
-    saved_path, original_name = await save_upload_file(file)
-    parsed_text = extract_text(saved_path)
+    temp_path, original_name, content_hash = await save_upload_file(file)
+    storage = get_storage()
+    key = content_key(content_hash, temp_path.suffix)
+    file_url = storage.url_for(key)
+    try:
+        parsed_text = await cached_parse(session, content_hash)
+        # End the lookup's transaction so the connection is not held idle in it while parsing.
+        await session.commit()
+        if parsed_text is None:
+            try:
+                parsed_text = await parse_resume(temp_path)
+            except ParserBusyError as exc:
+                raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+            except ResumeParseError as exc:
+                raise HTTPException(status_code=422, detail=str(exc)) from exc
+            await remember_parse(session, content_hash, parsed_text)
+        # Held until the commit below, so a concurrent delete of the same bytes waits for our row.
+        await lock_file(session, file_url)
+        await storage.put(key, temp_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
 
     resume = ResumeFile(
         user_id=current_user.id,
-        file_url=str(saved_path),
+        file_url=file_url,
         parsed_text=parsed_text,
         original_filename=original_name,
+        content_hash=content_hash,
+        structured_index=build_index(parsed_text),
     )
     session.add(resume)
     await session.commit()
@@ -43,25 +76,74 @@ async def upload_resume(
     )
 
 
-@router.get("/", response_model=list[ResumeUploadResponse])
+@router.get("/", response_model=list[ResumeUploadResponse], response_model_exclude_unset=True)
 async def list_resumes(
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    response: Response,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return. parsed_text is only loaded when listed.",
+    ),
+    page: PageParams | None = Depends(page_params),
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_user),
 ) -> list[ResumeUploadResponse]:
-    result = await session.execute(
-        select(ResumeFile).where(ResumeFile.user_id == current_user.id).order_by(ResumeFile.created_at.desc())
+    etag = await user_etag(request, session, current_user.id, "resumes")
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    include_text = "parsed_text" in parse_fields(fields, set(ResumeUploadResponse.model_fields))
+    stmt = (
+        select(ResumeFile)
+        .where(ResumeFile.user_id == current_user.id)
+        .order_by(ResumeFile.created_at.desc(), ResumeFile.id.desc())
     )
-    resumes = result.scalars().all()
-    return [
-        ResumeUploadResponse(
+    stmt = paginate(stmt, ResumeFile.created_at, ResumeFile.id, page)
+    stmt = stmt.options(defer(ResumeFile.structured_index))
+    if not include_text:
+        stmt = stmt.options(defer(ResumeFile.parsed_text))
+
+    result = await session.execute(stmt)
+    resumes = finish_page(response, result.scalars().all(), page, key=lambda res: (res.created_at, res.id))
+    records = [
+        ResumeUploadResponse.model_construct(
             resume_id=res.id,
             file_url=res.file_url,
-            parsed_text=res.parsed_text,
             uploaded_at=res.created_at,
             original_filename=res.original_filename,
+            **({"parsed_text": res.parsed_text} if include_text else {}),
         )
         for res in resumes
     ]
+    return json_response(list[ResumeUploadResponse], records, response, exclude_unset=True)
+
+
+@router.get("/{resume_id}/file", response_class=Response)
+async def download_resume(
+    resume_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """Stream the original upload from disk, or redirect to a presigned object-storage URL."""
+    result = await session.execute(
+        select(ResumeFile.file_url, ResumeFile.original_filename).where(
+            ResumeFile.id == resume_id,
+            ResumeFile.user_id == current_user.id,
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Resume not found.")
+
+    backend, key = resolve(row.file_url)
+    filename = row.original_filename or Path(key).name
+    media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    path = backend.local_path(key)
+    if path is not None:
+        return file_response(request, path, filename, media_type)
+    return RedirectResponse(await backend.presigned_url(key, filename, media_type), status_code=307)
 
 
 @router.delete("/{resume_id}", status_code=204, response_class=Response)
@@ -74,13 +156,9 @@ async def delete_resume(
     if not resume or resume.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Resume not found.")
 
-    file_path = Path(resume.file_url)
+    file_url = resume.file_url
     await session.delete(resume)
     await session.commit()
-
-    try:
-        file_path.unlink(missing_ok=True)
-    except OSError:
-        pass
+    await release_file(session, file_url)
 
     return Response(status_code=204)
@@ -1,29 +1,39 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import time
+from contextlib import suppress
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.core.config import get_settings
 from app.core.security import get_current_user
 from app.db.session import get_session
-from app.models.models import JobPosting, ResumeFile, ResumeTailoring, User
+from app.models.models import ExportJob, ExportStatusEnum, JobPosting, ResumeFile, ResumeTailoring, User
 from app.schemas import (
+    BulkSaveToDriveRequest,
+    ExportJobResponse,
     SaveToDriveRequest,
-    SaveToDriveResponse,
     TailoringActionRequest,
     TailoringActionResponse,
     TailoringRequest,
     TailoringResponse,
 )
 from app.services import llm
-from app.services.google import (
-    credentials_from_tokens,
-    normalize_expiry,
-    upload_text_document_to_drive,
-)
+from app.services.resume_sections import build_index, cover_letter_text, find_section
+from app.services.export_queue import export_queue
+from app.services.google_credentials import credential_manager, has_drive_tokens
+from app.services.scores import score_key, score_posting
 
 router = APIRouter(prefix="/tailoring", tags=["tailoring"])
 
+settings = get_settings()
+
+# How often a long-polling export request re-reads the job status.
+_EXPORT_POLL_SECONDS = 1.0
+
 
 @router.post("/", response_model=TailoringResponse)
 async def create_tailoring(
@@ -33,13 +43,18 @@ async def create_tailoring(
 ) -> TailoringResponse:
     resume = await _get_resume(session, payload.resume_id, current_user.id)
     job = await _get_job(session, payload.job_id)
+    # A fresh tailoring is usually exported next; have its Google token ready.
+    credential_manager.touch(current_user.id)
 
-    match_score = await llm.score_job_match(resume.parsed_text, job.description)
+    match_score, _ = await score_posting(session, score_key(resume), job)
     tailored_resume = await llm.generate_tailored_resume(
         resume.parsed_text, job.description, payload.instructions, match_score
     )
     cover_letter = await llm.generate_cover_letter(
-        resume.parsed_text, job.description, job.company, payload.instructions
+        cover_letter_text(resume.parsed_text, resume.structured_index),
+        job.description,
+        job.company,
+        payload.instructions,
     )
 
     tailoring = ResumeTailoring(
@@ -79,7 +94,10 @@ async def tailoring_action(
     text = payload.user_edits or (
         tailoring.tailored_resume_text if payload.editor == "resume" else tailoring.tailored_coverletter_text
     )
-    updated_text = await llm.adapt_text(payload.action, text, job.description)
+    if payload.section:
+        updated_text = await _adapt_section(payload.action, payload.section, text, job.description)
+    else:
+        updated_text = await llm.adapt_text(payload.action, text, job.description)
 
     if payload.editor == "resume":
         tailoring.tailored_resume_text = updated_text
@@ -91,58 +109,116 @@ async def tailoring_action(
     return TailoringActionResponse(updated_text=updated_text)
 
 
-@router.post("/save", response_model=SaveToDriveResponse)
+@router.post("/save", response_model=ExportJobResponse, status_code=202)
 async def save_to_drive(
     payload: SaveToDriveRequest,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
-) -> SaveToDriveResponse:
+) -> ExportJobResponse:
+    """Queue a Drive export; poll ``GET /tailoring/exports/{job_id}`` for the links."""
     tailoring = await session.get(ResumeTailoring, payload.tailoring_id)
     if not tailoring or tailoring.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Tailoring not found.")
 
-    job = await session.get(JobPosting, tailoring.job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found.")
-
-    if not current_user.google_access_token or not current_user.google_refresh_token or not current_user.google_token_expiry:
+    if not await has_drive_tokens(session, current_user.id):
         raise HTTPException(status_code=400, detail="User missing Google Drive tokens.")
+    credential_manager.touch(current_user.id)
 
-    normalized_expiry = normalize_expiry(current_user.google_token_expiry)
-    if normalized_expiry != current_user.google_token_expiry:
-        current_user.google_token_expiry = normalized_expiry
-        await session.commit()
-
-    creds = credentials_from_tokens(
-        current_user.google_access_token,
-        current_user.google_refresh_token,
-        normalized_expiry,
+    job = ExportJob(
+        user_id=current_user.id,
+        tailoring_id=tailoring.id,
+        save_resume=payload.save_resume,
+        save_cover_letter=payload.save_cover_letter,
     )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    export_queue.enqueue(job.id)
+    return _export_response(job)
 
-    resume_url = cover_letter_url = None
 
-    if payload.save_resume:
-        resume_url = upload_text_document_to_drive(
-            creds=creds,
-            file_name=f"resume_{job.title}_{job.company}.docx",
-            mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            content=tailoring.tailored_resume_text,
+@router.post("/save/bulk", response_model=ExportJobResponse, status_code=202)
+async def bulk_save_to_drive(
+    payload: BulkSaveToDriveRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ExportJobResponse:
+    """Queue one export of many tailorings into a single new Drive folder."""
+    tailoring_ids = list(dict.fromkeys(payload.tailoring_ids))
+    if len(tailoring_ids) > settings.EXPORT_BULK_MAX_TAILORINGS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.EXPORT_BULK_MAX_TAILORINGS} tailorings per export.",
         )
-
-    if payload.save_cover_letter:
-        cover_letter_url = upload_text_document_to_drive(
-            creds=creds,
-            file_name=f"coverletter_{job.title}_{job.company}.docx",
-            mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            content=tailoring.tailored_coverletter_text,
+    result = await session.execute(
+        select(ResumeTailoring.id).where(
+            ResumeTailoring.id.in_(tailoring_ids),
+            ResumeTailoring.user_id == current_user.id,
         )
+    )
+    missing = set(tailoring_ids) - set(result.scalars().all())
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Tailorings not found: {', '.join(sorted(missing))}.")
 
-    tailoring.saved_to_drive = True
-    tailoring.drive_resume_url = resume_url
-    tailoring.drive_coverletter_url = cover_letter_url
+    if not await has_drive_tokens(session, current_user.id):
+        raise HTTPException(status_code=400, detail="User missing Google Drive tokens.")
+    credential_manager.touch(current_user.id)
+
+    job = ExportJob(
+        user_id=current_user.id,
+        tailoring_ids=tailoring_ids,
+        save_resume=payload.save_resume,
+        save_cover_letter=payload.save_cover_letter,
+    )
+    session.add(job)
     await session.commit()
+    await session.refresh(job)
+    export_queue.enqueue(job.id)
+    return _export_response(job)
 
-    return SaveToDriveResponse(resume_url=resume_url, cover_letter_url=cover_letter_url)
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to hold the request open until the export finishes."),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ExportJobResponse:
+    # Watch before reading the status, so a job finishing in between still wakes us.
+    with export_queue.watching(job_id) as finished:
+        job = await session.get(ExportJob, job_id)
+        if not job or job.user_id != current_user.id:
+            raise HTTPException(status_code=404, detail="Export not found.")
+
+        deadline = time.monotonic() + min(wait, settings.EXPORT_MAX_WAIT_SECONDS)
+        # The event only fires for exports run by this worker, so the status is re-read as well.
+        while job.status in (ExportStatusEnum.QUEUED, ExportStatusEnum.RUNNING):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # End the read transaction so the pooled connection is not held while waiting.
+            await session.rollback()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(finished.wait(), timeout=min(remaining, _EXPORT_POLL_SECONDS))
+            await session.refresh(job)
+    return _export_response(job)
+
+
+def _export_response(job: ExportJob) -> ExportJobResponse:
+    return ExportJobResponse(
+        job_id=job.id,
+        tailoring_id=job.tailoring_id,
+        tailoring_ids=job.tailoring_ids,
+        status=job.status,
+        attempts=job.attempts,
+        error=job.error,
+        resume_url=job.resume_url,
+        cover_letter_url=job.cover_letter_url,
+        folder_url=job.folder_url,
+        documents=job.documents or [],
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
 
 
 async def _get_resume(session: AsyncSession, resume_id: str | None, user_id: str) -> ResumeFile:
@@ -163,3 +239,14 @@ async def _get_job(session: AsyncSession, job_id: str) -> JobPosting:
     if not job:
         raise HTTPException(status_code=404, detail="Job not found.")
     return job
+
+
+async def _adapt_section(action: str, section_name: str, text: str, job_description: str) -> str:
+    """Rewrite one section of ``text`` and splice it back, leaving the rest untouched."""
+    section = find_section(build_index(text), section_name)
+    if section is None:
+        raise HTTPException(status_code=422, detail=f"Section '{section_name}' not found.")
+    body = text[section["start"] : section["end"]]
+    rewritten = await llm.adapt_text(action, body.strip(), job_description)
+    trailing = body[len(body.rstrip()) :]
+    return f"{text[: section['start']]}{rewritten.strip()}{trailing}{text[section['end'] :]}"
@@ -0,0 +1,121 @@
+"""Maintenance commands: ``python -m app.cli <command>``."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import subprocess
+import sys
+from collections import defaultdict
+
+
+async def _backfill_status_events() -> None:
+    from app.db.session import async_session_factory
+    from app.services.status_history import backfill_status_events
+
+    async with async_session_factory() as session:
+        created = await backfill_status_events(session)
+    print(f"Backfilled {created} status events.")
+
+
+async def _retention() -> None:
+    from app.db.session import async_session_factory
+    from app.services.retention import apply_retention
+
+    async with async_session_factory() as session:
+        report = await apply_retention(session)
+    print(
+        f"Archived {report.archived}, compacted {report.compacted} postings; "
+        f"deleted {report.searches_deleted} searches; dropped {report.partitions_dropped} archive partitions."
+    )
+
+
+async def _parse_report(paths: list[str]) -> None:
+    """Parse files through the worker pool and report wall time per page and peak RSS."""
+    import resource
+    import time
+    from pathlib import Path
+
+    from app.services import parse_pool
+
+    print(f"{'file':<40} {'pages':>6} {'chars':>8} {'ms':>8} {'ms/page':>8}")
+    for name in paths:
+        pages_before = parse_pool.metrics.pages
+        started = time.perf_counter()
+        text = await parse_pool.parse_resume(Path(name))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        pages = parse_pool.metrics.pages - pages_before or 1
+        print(f"{Path(name).name:<40} {pages:>6} {len(text):>8} {elapsed_ms:>8.0f} {elapsed_ms / pages:>8.1f}")
+
+    # Children only show up in RUSAGE_CHILDREN once they have exited.
+    parse_pool.shutdown_parse_pool(wait=True)
+    worker_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    main_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"Peak RSS: main {main_kb / 1024:.0f} MB, largest worker {worker_kb / 1024:.0f} MB")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Self import time in microseconds of every module loaded by importing ``module`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        print(completed.stderr, file=sys.stderr)
+        raise SystemExit(completed.returncode)
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        times[name] = int(self_us)
+    return times
+
+
+def _import_report(module: str, top: int) -> None:
+    """Print per-package cumulative import cost of ``module`` using ``python -X importtime``."""
+    own_cost: dict[str, int] = defaultdict(int)
+    for name, self_us in import_times(module).items():
+        own_cost[name.split(".")[0]] += self_us
+    total = sum(own_cost.values())
+
+    print(f"Importing {module} took {total / 1000:.0f} ms")
+    print(f"{'package':<32} {'ms':>8} {'share':>7}")
+    for package, cost in sorted(own_cost.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{package:<32} {cost / 1000:>8.1f} {cost / max(total, 1):>7.1%}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "backfill-status-events",
+        help="Seed the status event log from existing applications and rebuild dashboard series.",
+    )
+
+    commands.add_parser(
+        "retention",
+        help="Archive or compact stale job postings and prune old searches (run from cron).",
+    )
+    parse = commands.add_parser("parse-report", help="Time resume extraction per page and report peak memory.")
+    parse.add_argument("paths", nargs="+")
+    report = commands.add_parser("import-report", help="Show where import time goes when loading the app.")
+    report.add_argument("--module", default="app.main")
+    report.add_argument("--top", type=int, default=25)
+
+    args = parser.parse_args(argv)
+    if args.command == "backfill-status-events":
+        asyncio.run(_backfill_status_events())
+    elif args.command == "retention":
+        asyncio.run(_retention())
+    elif args.command == "parse-report":
+        asyncio.run(_parse_report(args.paths))
+    elif args.command == "import-report":
+        _import_report(args.module, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+class _Encoder:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes) -> bytes:
+        """Compress ``data`` and flush so the client can decode it immediately."""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+    def whole(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Negotiate brotli or gzip for responses above ``minimum_size`` bytes.
+
+    Streaming responses are held back only until ``minimum_size`` bytes have
+    arrived and are then compressed chunk by chunk, so streamed JSON keeps arriving
+    incrementally while short streams still go out uncompressed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, _CompressingResponder(send, encoder, self.minimum_size))
+
+    @staticmethod
+    def _negotiate(accept_encoding: str) -> Optional[str]:
+        offered = set()
+        for part in accept_encoding.split(","):
+            name, _, params = part.partition(";")
+            key, _, quality = params.strip().partition("=")
+            try:
+                if key.strip() == "q" and float(quality) == 0:
+                    continue
+            except ValueError:
+                continue
+            offered.add(name.strip().lower())
+        if brotli is not None and "br" in offered:
+            return "br"
+        if "gzip" in offered:
+            return "gzip"
+        return None
+
+
+class _CompressingResponder:
+    def __init__(self, send: Send, encoder: _Encoder, minimum_size: int) -> None:
+        self.send = send
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.streaming = False
+        self.pending = bytearray()
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            # Byte-range responses must reach the client exactly as stored.
+            self.passthrough = (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or "accept-ranges" in headers
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            # Zero-copy and other body extensions are sent as is, after the headers they belong to.
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.streaming:
+            # Undecided until the body ends or passes the threshold.
+            self.pending += body
+            if not more_body:
+                body = bytes(self.pending)
+                if len(body) < self.minimum_size:
+                    await self._flush_start()
+                    await self.send({"type": "http.response.body", "body": body})
+                    return
+                compressed = self.encoder.whole(body)
+                await self._flush_start(content_length=len(compressed))
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            if len(self.pending) < self.minimum_size:
+                return
+            self.streaming = True
+            body, self.pending = bytes(self.pending), bytearray()
+            await self._flush_start(content_length=None)
+
+        payload = self.encoder.chunk(body) if body else b""
+        if not more_body:
+            payload += self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+    async def _flush_start(self, content_length: Optional[int] = -1) -> None:
+        """Send the held start message; ``-1`` leaves headers untouched."""
+        if self.start_message is None:
+            return
+        message, self.start_message = self.start_message, None
+        if content_length != -1:
+            headers = MutableHeaders(raw=message["headers"])
+            headers["Content-Encoding"] = self.encoder.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if content_length is None:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(content_length)
+        await self.send(message)
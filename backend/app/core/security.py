@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -7,6 +8,7 @@ from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.db.session import get_session
 from app.models.models import User
@@ -15,6 +17,18 @@ settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/token")
 
+# token -> subject; entries live until the token's own expiry.
+_claims_cache: TTLCache[str, str] = TTLCache(
+    maxsize=settings.AUTH_CLAIMS_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+# subject -> detached User snapshot; credentials stay out of process memory.
+_UNCACHED_FIELDS = {"google_access_token", "google_refresh_token", "google_token_expiry"}
+_user_cache: TTLCache[str, User] = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     expire = datetime.now(timezone.utc) + (
@@ -24,24 +38,58 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_session)
-) -> User:
-    credentials_exception = HTTPException(
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop the cached principal so the next request reloads it from the database."""
+    _user_cache.pop(user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def token_subject(token: str) -> str:
+    user_id = _claims_cache.get(token)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
     except JWTError as exc:
-        raise credentials_exception from exc
+        raise _credentials_exception() from exc
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise _credentials_exception()
+
+    remaining = float(payload.get("exp", 0)) - time.time()
+    if remaining > 0:
+        _claims_cache.set(token, user_id, ttl=remaining)
+    return user_id
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_session)
+) -> User:
+    """Return the authenticated user, served from a short-lived cache when possible.
+
+    The result is a detached snapshot without the Google tokens: use it for
+    ``id``/``name``/``email`` and load the row when the route needs more.
+    """
+    user_id = token_subject(token)
+    # Lets the read/write router remember who wrote through this session.
+    session.info["user_id"] = user_id
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
 
     result = await session.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    snapshot = User.model_validate(user.model_dump(exclude=_UNCACHED_FIELDS))
+    _user_cache.set(user_id, snapshot)
+    return snapshot
+
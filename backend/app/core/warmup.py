@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Dependencies the services import lazily on first use.
+HEAVY_MODULES = (
+    "langchain.schema",
+    "langchain_community.chat_models",
+    "google.oauth2.credentials",
+    "googleapiclient.discovery",
+    "googleapiclient.http",
+    "pypdf",
+    "docx",
+)
+
+
+def import_heavy_modules() -> None:
+    for name in HEAVY_MODULES:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.warning("Pre-warm skipped %s: not importable.", name)
+            continue
+        logger.debug("Pre-warmed %s in %.0f ms", name, (time.perf_counter() - started) * 1000)
+
+
+async def prewarm_after(delay: float) -> None:
+    """Import the heavy modules in a worker thread once the server is taking requests."""
+    await asyncio.sleep(delay)
+    await asyncio.to_thread(import_heavy_modules)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    slow_checkouts: int = 0
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    saturated_checkouts: int = 0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.slow_checkout_ms = 100.0
+        self.metrics = PoolMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # dispose() swaps in a fresh pool built from the standard arguments only.
+        pool = super().recreate()
+        pool.slow_checkout_ms = self.slow_checkout_ms
+        return pool
+
+    def _do_get(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.metrics.timeouts += 1
+            logger.warning("Database pool exhausted: %s", self.status())
+            raise
+        self._record(started)
+        return connection
+
+    def _record(self, started: float) -> None:
+        waited_ms = (time.perf_counter() - started) * 1000
+        saturated = self._max_overflow >= 0 and self.checkedout() >= self.size() + self._max_overflow
+        with self._metrics_lock:
+            self.metrics.checkouts += 1
+            self.metrics.total_wait_ms += waited_ms
+            self.metrics.max_wait_ms = max(self.metrics.max_wait_ms, waited_ms)
+            if saturated:
+                self.metrics.saturated_checkouts += 1
+            if waited_ms >= self.slow_checkout_ms:
+                self.metrics.slow_checkouts += 1
+        if waited_ms >= self.slow_checkout_ms:
+            logger.warning("Slow database pool checkout (%.1f ms): %s", waited_ms, self.status())
+
+
+def build_engine(url: str, settings: Settings) -> AsyncEngine:
+    url = url.replace("postgresql+psycopg", "postgresql+asyncpg")
+    options: Dict[str, Any] = {
+        "echo": settings.LOG_LEVEL.upper() == "DEBUG",
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if not url.startswith("postgresql+asyncpg"):
+        return create_async_engine(url, **options)
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer in transaction mode cannot route named prepared statements back
+        # to the server that prepared them, so disable both statement caches and
+        # give every statement a unique name.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    else:
+        options["connect_args"] = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    engine = create_async_engine(url, **options)
+    engine.pool.slow_checkout_ms = settings.DB_POOL_SLOW_CHECKOUT_MS
+    return engine
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pooled connections up front so first requests skip the handshake."""
+    if connections <= 0:
+        return
+
+    # Hold every connection until all are open, otherwise the pool would hand the
+    # same one out repeatedly.
+    opened = await asyncio.gather(*(engine.connect().start() for _ in range(connections)))
+    for connection in opened:
+        await connection.close()
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            **asdict(pool.metrics),
+        )
+    return stats
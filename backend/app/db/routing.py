@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.db.session import async_session_factory, engine, replica_engine
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# The client carries the time of its last committed write, so whichever worker
+# serves its next read knows to skip the replica.
+WRITE_MARKER_COOKIE = "last_write"
+
+# Wall-clock times of the writes committed while handling the current request.
+_request_writes: ContextVar[Optional[List[float]]] = ContextVar("request_writes", default=None)
+
+
+class _ReplicaHealth:
+    def __init__(self) -> None:
+        self.healthy = True
+        self.checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def mark_failed(self) -> None:
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+    async def is_usable(self) -> bool:
+        if time.monotonic() - self.checked_at < settings.DB_REPLICA_CHECK_INTERVAL_SECONDS:
+            return self.healthy
+        async with self._lock:
+            if time.monotonic() - self.checked_at >= settings.DB_REPLICA_CHECK_INTERVAL_SECONDS:
+                self.healthy = await _replica_within_lag()
+                self.checked_at = time.monotonic()
+        return self.healthy
+
+
+_replica_health = _ReplicaHealth()
+
+
+# The last replayed transaction ages while the primary is idle, so a replica that
+# has replayed everything it received counts as caught up.
+_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+async def _replica_within_lag() -> bool:
+    timeout = settings.DB_REPLICA_PROBE_TIMEOUT_SECONDS
+    try:
+        lag = await asyncio.wait_for(_replica_lag(timeout), timeout=timeout)
+    except (OSError, DBAPIError, asyncio.TimeoutError):
+        logger.warning("Read replica unreachable; routing reads to the primary.", exc_info=True)
+        return False
+    if lag is not None and float(lag) > settings.DB_REPLICA_MAX_LAG_SECONDS:
+        logger.warning("Read replica lagging by %.1fs; routing reads to the primary.", float(lag))
+        return False
+    return True
+
+
+async def _replica_lag(timeout: float) -> Any:
+    async with replica_engine.connect() as conn:
+        await conn.execute(text(f"SET LOCAL statement_timeout = {int(timeout * 1000)}"))
+        return await conn.scalar(_LAG_QUERY)
+
+
+class ReplicaSession(AsyncSession):
+    """Read-only session that reruns a statement on the primary when the replica fails it.
+
+    Only statements are retried, so it must not be used for writes.
+    """
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().execute(statement, *args, **kwargs)
+        except (OSError, DBAPIError):
+            if not await self._fall_back():
+                raise
+        return await super().execute(statement, *args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().get(*args, **kwargs)
+        except (OSError, DBAPIError):
+            if not await self._fall_back():
+                raise
+        return await super().get(*args, **kwargs)
+
+    async def _fall_back(self) -> bool:
+        if self.sync_session.bind is engine.sync_engine:
+            return False
+        logger.warning("Read replica query failed; retrying on the primary.", exc_info=True)
+        _replica_health.mark_failed()
+        await self.rollback()
+        self.sync_session.bind = engine.sync_engine
+        return True
+
+
+replica_session_factory = (
+    sessionmaker(bind=replica_engine, class_=ReplicaSession, expire_on_commit=False) if replica_engine else None
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_write(session: Session, flush_context) -> None:  # noqa: ANN001
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_writer(session: Session) -> None:
+    writes = _request_writes.get()
+    if session.info.pop("wrote", False) and session.info.get("user_id") and writes is not None:
+        writes.append(time.time())
+
+
+class ReadYourWritesMiddleware:
+    """Set the write marker cookie on responses to requests that committed a user's write."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        writes: List[float] = []
+        token = _request_writes.set(writes)
+
+        async def send_with_marker(message: Message) -> None:
+            if message["type"] == "http.response.start" and writes:
+                MutableHeaders(scope=message).append("set-cookie", _marker_cookie(writes[-1]))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_marker)
+        finally:
+            _request_writes.reset(token)
+
+
+def _marker_cookie(written_at: float) -> str:
+    max_age = math.ceil(settings.DB_READ_YOUR_WRITES_SECONDS)
+    return f"{WRITE_MARKER_COOKIE}={written_at:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=lax"
+
+
+def _wrote_recently(request: Request) -> bool:
+    try:
+        written_at = float(request.cookies.get(WRITE_MARKER_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - written_at < settings.DB_READ_YOUR_WRITES_SECONDS
+
+
+async def get_read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Session for read-only routes: the replica when configured, healthy and not stale for this client."""
+    use_replica = (
+        replica_session_factory is not None
+        and not _wrote_recently(request)
+        and await _replica_health.is_usable()
+    )
+    if not use_replica:
+        async with async_session_factory() as session:
+            yield session
+        return
+
+    async with replica_session_factory() as session:
+        yield session
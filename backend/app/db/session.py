@@ -1,16 +1,22 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from pathlib import Path
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlmodel import SQLModel
 
 from app.core.config import get_settings
+from app.db import versioning  # noqa: F401
+from app.db.pool import build_engine, warm_up
 from app.models import models  # noqa: F401
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.DATABASE_URL.replace("postgresql+psycopg", "postgresql+asyncpg"),
-    echo=settings.LOG_LEVEL.upper() == "DEBUG",
-)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+# Revision matching the schema produced by the old ``SQLModel.metadata.create_all``.
+BASELINE_REVISION = "0001"
+
+engine = build_engine(settings.DATABASE_URL, settings)
 
 async_session_factory = sessionmaker(
     bind=engine,
@@ -18,10 +24,27 @@ async_session_factory = sessionmaker(
     expire_on_commit=False,
 )
 
+replica_engine = build_engine(settings.DATABASE_REPLICA_URL, settings) if settings.DATABASE_REPLICA_URL else None
+
 
 async def init_db() -> None:
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    if settings.DB_MIGRATE_ON_STARTUP:
+        async with engine.begin() as conn:
+            await conn.run_sync(_run_migrations)
+    await warm_up(engine, min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE))
+
+
+def _run_migrations(connection: Connection) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    tables = set(inspect(connection).get_table_names())
+    if "users" in tables and "alembic_version" not in tables:
+        # Databases created before migrations existed already hold the baseline schema.
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
 
 
 async def get_session() -> AsyncSession:
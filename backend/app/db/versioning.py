@@ -0,0 +1,44 @@
+"""Keep ``User.data_version`` in step with writes to the user's data."""
+from __future__ import annotations
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app.models.models import (
+    ApplicationStatus,
+    JobPosting,
+    JobSearchHistory,
+    ResumeFile,
+    ResumeTailoring,
+    User,
+)
+
+VERSIONED_MODELS = (ApplicationStatus, JobPosting, JobSearchHistory, ResumeFile, ResumeTailoring)
+
+_users = User.__table__
+
+
+def bump_data_version(session: Session, user_id: str) -> None:
+    """Increment the user's data version once per transaction."""
+    if session.info.get("data_version_bumped"):
+        return
+    session.connection().execute(
+        update(_users).where(_users.c.id == user_id).values(data_version=_users.c.data_version + 1)
+    )
+    session.info["data_version_bumped"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_on_flush(session: Session, flush_context) -> None:  # noqa: ANN001
+    user_id = session.info.get("user_id")
+    if not user_id:
+        return
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(instance, VERSIONED_MODELS) for instance in changed):
+        bump_data_version(session, user_id)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _reset(session: Session, transaction) -> None:  # noqa: ANN001
+    if transaction.parent is None:
+        session.info.pop("data_version_bumped", None)
@@ -1,14 +1,28 @@
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import auth, dashboard, jobs, tailoring, resumes
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.routes import auth, dashboard, health, jobs, tailoring, resumes
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
+from app.core.warmup import prewarm_after
+from app.db.routing import ReadYourWritesMiddleware
 from app.db.session import init_db
+from app.services.export_queue import export_queue
+from app.services.google import close_http_client
+from app.services.google_credentials import run_token_refresher
+from app.services.parse_pool import shutdown_parse_pool
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title=settings.PROJECT_NAME)
+    app = FastAPI(title=settings.PROJECT_NAME, default_response_class=ORJSONResponse)
+
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
 
     if settings.FRONTEND_ORIGINS:
         allowed_origins = [str(origin).rstrip("/") for origin in settings.FRONTEND_ORIGINS]
@@ -18,6 +32,7 @@ def create_app() -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[NEXT_CURSOR_HEADER],
         )
 
     app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
@@ -25,11 +40,28 @@ def create_app() -> FastAPI:
     app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
     app.include_router(tailoring.router, prefix=settings.API_V1_PREFIX)
     app.include_router(dashboard.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(health.router, prefix=settings.API_V1_PREFIX)
 
     @app.on_event("startup")
     async def on_startup() -> None:
         settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
         await init_db()
+        await export_queue.start()
+        if settings.PREWARM_HEAVY_IMPORTS:
+            # Startup hooks finish before uvicorn accepts connections; the delay
+            # lets the first requests through before the imports compete for CPU.
+            app.state.prewarm_task = asyncio.create_task(prewarm_after(settings.PREWARM_DELAY_SECONDS))
+        if settings.GOOGLE_TOKEN_BACKGROUND_REFRESH:
+            app.state.token_refresher = asyncio.create_task(run_token_refresher())
+
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        refresher = getattr(app.state, "token_refresher", None)
+        if refresher is not None:
+            refresher.cancel()
+        await export_queue.stop()
+        await close_http_client()
+        shutdown_parse_pool()
 
     return app
 
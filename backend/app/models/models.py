@@ -1,9 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, JSON, DateTime
+from sqlalchemy import Column, JSON, DateTime, Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -22,6 +22,8 @@ class User(TimestampedBase, table=True):
     google_access_token: Optional[str] = None
     google_refresh_token: Optional[str] = None
     google_token_expiry: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    # Bumped on every write to the user's data; backs the API's ETags.
+    data_version: int = Field(default=0, nullable=False)
 
     resumes: list["ResumeFile"] = Relationship(back_populates="user")
     searches: list["JobSearchHistory"] = Relationship(back_populates="user")
@@ -31,21 +33,27 @@ class User(TimestampedBase, table=True):
 
 class ResumeFile(TimestampedBase, table=True):
     __tablename__ = "resume_files"
+    __table_args__ = (Index("ix_resume_files_user_id_created_at", "user_id", "created_at"),)
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True, index=True)
     user_id: str = Field(foreign_key="users.id")
     file_url: str
     parsed_text: str
     original_filename: Optional[str] = None
+    # SHA-256 of the uploaded bytes; identical uploads share one stored file.
+    content_hash: Optional[str] = Field(default=None, index=True)
+    # Sections, bullets, dates and skills as offsets into parsed_text; see services.resume_sections.
+    structured_index: Optional[dict] = Field(default=None, sa_column=Column(JSON))
 
     user: User = Relationship(back_populates="resumes")
 
 
 class JobSearchHistory(TimestampedBase, table=True):
     __tablename__ = "job_search_history"
+    __table_args__ = (Index("ix_job_search_history_created_at", "created_at"),)
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True, index=True)
-    user_id: str = Field(foreign_key="users.id")
+    user_id: str = Field(foreign_key="users.id", index=True)
     query_parameters: dict = Field(sa_column=Column(JSON))
 
     user: User = Relationship(back_populates="searches")
@@ -54,15 +62,18 @@ class JobSearchHistory(TimestampedBase, table=True):
 
 class JobPosting(TimestampedBase, table=True):
     __tablename__ = "job_postings"
+    __table_args__ = (Index("ix_job_postings_created_at", "created_at"),)
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True, index=True)
-    search_id: str = Field(foreign_key="job_search_history.id")
+    search_id: str = Field(foreign_key="job_search_history.id", index=True)
     title: str
     company: str
     location: str
     description: str
     snippet: Optional[str] = None
     url: str
+    # Normalized ``url`` (see ``job_store.posting_url_key``) that match-score lookups compare on.
+    url_key: Optional[str] = Field(default=None, index=True)
     application_link: Optional[str] = None
     match_score: Optional[float] = None
     work_mode: Optional[str] = None
@@ -78,6 +89,9 @@ class JobPosting(TimestampedBase, table=True):
 
 class ResumeTailoring(TimestampedBase, table=True):
     __tablename__ = "resume_tailorings"
+    __table_args__ = (
+        Index("ix_resume_tailorings_user_id_job_id_updated_at", "user_id", "job_id", "updated_at"),
+    )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True, index=True)
     user_id: str = Field(foreign_key="users.id")
@@ -103,6 +117,10 @@ class ApplicationStatusEnum(str, Enum):
 
 class ApplicationStatus(TimestampedBase, table=True):
     __tablename__ = "application_status"
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id", name="uq_application_status_user_id_job_id"),
+        Index("ix_application_status_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True, index=True)
     user_id: str = Field(foreign_key="users.id")
@@ -113,3 +131,140 @@ class ApplicationStatus(TimestampedBase, table=True):
 
     user: User = Relationship(back_populates="applications")
     job_posting: JobPosting = Relationship(back_populates="applications")
+
+
+class ApplicationStatusRollup(SQLModel, table=True):
+    """Per-user daily application counts by status, maintained on every status write."""
+
+    __tablename__ = "application_status_rollups"
+
+    user_id: str = Field(foreign_key="users.id", primary_key=True)
+    day: date = Field(primary_key=True)
+    status: str = Field(primary_key=True)
+    count: int = Field(default=0, nullable=False)
+
+
+class ApplicationStatusEvent(SQLModel, table=True):
+    """Append-only log of application status transitions."""
+
+    __tablename__ = "application_status_events"
+    __table_args__ = (Index("ix_application_status_events_user_id_occurred_at", "user_id", "occurred_at"),)
+
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    user_id: str = Field(foreign_key="users.id")
+    job_id: str
+    from_status: Optional[str] = None
+    to_status: Optional[str] = None
+    occurred_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+class UserStatusSeries(SQLModel, table=True):
+    """Columnar cumulative status counts per user, folded from ``ApplicationStatusEvent``.
+
+    ``daily`` and ``weekly`` hold ``{"labels": [...], "columns": {status: [...]}}``.
+    """
+
+    __tablename__ = "user_status_series"
+
+    user_id: str = Field(foreign_key="users.id", primary_key=True)
+    daily: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    weekly: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+class JobPostingArchive(SQLModel, table=True):
+    """Postings moved out of ``job_postings`` by the retention job.
+
+    On Postgres the table is range-partitioned by month on ``created_at`` so old
+    months can be detached and dropped without scanning.
+    """
+
+    __tablename__ = "job_postings_archive"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
+
+    id: str = Field(primary_key=True)
+    created_at: datetime = Field(primary_key=True)
+    updated_at: datetime
+    search_id: str
+    title: str
+    company: str
+    location: str
+    description: str
+    snippet: Optional[str] = None
+    url: str
+    application_link: Optional[str] = None
+    match_score: Optional[float] = None
+    work_mode: Optional[str] = None
+    experience_level: Optional[str] = None
+    skills: Optional[list[str]] = Field(default=None, sa_column=Column(JSON))
+    posting_date: Optional[datetime] = None
+    company_logo_url: Optional[str] = None
+    archived_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+class ResumeParseResult(SQLModel, table=True):
+    """Extracted text per stored file content, reused across identical uploads.
+
+    Keyed by parser version too, so a parser change re-parses on the next upload.
+    """
+
+    __tablename__ = "resume_parse_results"
+
+    content_hash: str = Field(primary_key=True)
+    parser_version: str = Field(primary_key=True)
+    parsed_text: str
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
+class ExportStatusEnum(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ExportJob(TimestampedBase, table=True):
+    """A queued Drive export of one tailoring; see ``services.export_queue``."""
+
+    __tablename__ = "export_jobs"
+    __table_args__ = (Index("ix_export_jobs_status_created_at", "status", "created_at"),)
+
+    id: str = Field(default_factory=lambda: str(uuid4()), primary_key=True)
+    user_id: str = Field(foreign_key="users.id", index=True)
+    # Set for single exports; bulk exports list their tailorings in ``tailoring_ids``.
+    tailoring_id: Optional[str] = Field(default=None, foreign_key="resume_tailorings.id")
+    tailoring_ids: Optional[list[str]] = Field(default=None, sa_column=Column(JSON))
+    status: str = Field(default=ExportStatusEnum.QUEUED)
+    save_resume: bool = Field(default=True)
+    save_cover_letter: bool = Field(default=True)
+    attempts: int = Field(default=0)
+    error: Optional[str] = None
+    resume_url: Optional[str] = None
+    cover_letter_url: Optional[str] = None
+    folder_id: Optional[str] = None
+    folder_url: Optional[str] = None
+    # One entry per document: {"tailoring_id", "kind", "url", "error"}.
+    documents: Optional[list[dict]] = Field(default=None, sa_column=Column(JSON))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class ResumeJobScore(SQLModel, table=True):
+    """LLM match score of one resume against one posting; see ``services.scores``.
+
+    A row only counts while its model, prompt version and resume digest match the
+    current ones, so a new model or a changed resume scores again.
+    """
+
+    __tablename__ = "resume_job_scores"
+    __table_args__ = (Index("ix_resume_job_scores_user_id_job_id", "user_id", "job_id"),)
+
+    resume_id: str = Field(foreign_key="resume_files.id", primary_key=True, ondelete="CASCADE")
+    job_id: str = Field(foreign_key="job_postings.id", primary_key=True, ondelete="CASCADE")
+    user_id: str = Field(foreign_key="users.id")
+    score: float
+    model: str
+    prompt_version: str
+    # SHA-256 of the resume text the score was computed from.
+    resume_digest: str
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
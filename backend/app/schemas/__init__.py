@@ -1,9 +1,9 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, EmailStr, Field, HttpUrl
 
-from app.models.models import ApplicationStatusEnum
+from app.models.models import ApplicationStatusEnum, ExportStatusEnum
 
 
 class Token(BaseModel):
@@ -29,7 +29,7 @@ class UserRead(BaseModel):
 class ResumeUploadResponse(BaseModel):
     resume_id: str
     file_url: str
-    parsed_text: str
+    parsed_text: Optional[str] = None
     uploaded_at: datetime
     original_filename: Optional[str] = None
 
@@ -52,7 +52,7 @@ class JobPostingRead(BaseModel):
     title: str
     company: str
     location: str
-    description: str
+    description: Optional[str] = None
     snippet: Optional[str] = None
     url: HttpUrl
     application_link: Optional[HttpUrl] = None
@@ -97,6 +97,8 @@ class TailoringActionRequest(BaseModel):
     action: Literal["regenerate", "improve", "shorten", "professional", "match_jd"]
     editor: Literal["resume", "cover_letter"]
     user_edits: Optional[str] = None
+    # Limit the rewrite to one detected section, e.g. "experience" or "skills".
+    section: Optional[str] = None
 
 
 class TailoringActionResponse(BaseModel):
@@ -114,6 +116,32 @@ class SaveToDriveResponse(BaseModel):
     cover_letter_url: Optional[HttpUrl] = None
 
 
+class BulkSaveToDriveRequest(BaseModel):
+    tailoring_ids: List[str] = Field(min_length=1)
+    save_resume: bool = True
+    save_cover_letter: bool = True
+
+
+class ExportDocumentResult(BaseModel):
+    tailoring_id: str
+    kind: Optional[Literal["resume", "cover_letter"]] = None
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ExportJobResponse(SaveToDriveResponse):
+    job_id: str
+    tailoring_id: Optional[str] = None
+    tailoring_ids: Optional[List[str]] = None
+    status: ExportStatusEnum
+    attempts: int
+    error: Optional[str] = None
+    folder_url: Optional[str] = None
+    documents: List[ExportDocumentResult] = []
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
 class TailoringRecord(TailoringResponse):
     drive_resume_url: Optional[str] = None
     drive_coverletter_url: Optional[str] = None
@@ -141,6 +169,7 @@ class DashboardSummary(BaseModel):
     rejections: int
     weekly_applications: List[dict]
     status_over_time: List[dict]
+    status_over_time_weekly: List[dict] = []
 
 
 class ApplicationRecord(BaseModel):
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import io
+
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+_BULLETS = ("- ", "* ", "• ", "▪ ", "● ")
+
+
+def render_docx(text: str) -> bytes:
+    """Lay plain resume or cover-letter text out as a Word document.
+
+    Runs in the worker processes, so it must stay a picklable top-level function.
+    """
+    from docx import Document
+
+    document = Document()
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line.startswith(_BULLETS):
+            document.add_paragraph(line[2:].strip(), style="List Bullet")
+        else:
+            document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,295 @@
+"""In-process worker queue for Drive exports.
+
+Jobs live in ``export_jobs``; the queue only carries their ids. Workers claim a
+job with a conditional UPDATE, so several app processes can share the table
+without exporting the same job twice, and queued jobs survive a restart.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.config import get_settings
+from app.db.session import async_session_factory
+from app.models.models import ExportJob, ExportStatusEnum, JobPosting, ResumeTailoring, User
+from app.services.documents import DOCX_MIME_TYPE, render_docx
+from app.services.google import DriveDocument, create_drive_folder, upload_documents_to_drive
+from app.services.google_credentials import MissingGoogleTokensError, credential_manager
+from app.services.parse_pool import run_in_worker
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class ExportError(RuntimeError):
+    """Raised for export failures that retrying cannot fix."""
+
+
+@dataclass
+class ExportMetrics:
+    enqueued: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    total_run_ms: float = 0.0
+    max_run_ms: float = 0.0
+
+
+@dataclass
+class _Watch:
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    watchers: int = 0
+
+
+class ExportQueue:
+    def __init__(self) -> None:
+        self.metrics = ExportMetrics()
+        self._queue: Optional[asyncio.Queue[str]] = None
+        self._workers: List[asyncio.Task] = []
+        self._running = 0
+        self._finished: Dict[str, _Watch] = {}
+        self._render_slots: Optional[asyncio.Semaphore] = None
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._render_slots = asyncio.Semaphore(
+            max(1, min(settings.EXPORT_RENDER_CONCURRENCY, settings.PARSER_MAX_WORKERS - 1))
+        )
+        self._workers = [asyncio.create_task(self._work()) for _ in range(settings.EXPORT_WORKERS)]
+        await self._recover()
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    def enqueue(self, job_id: str) -> None:
+        if self._queue is None:
+            raise RuntimeError("Export queue is not running.")
+        self._queue.put_nowait(job_id)
+        self.metrics.enqueued += 1
+
+    @contextmanager
+    def watching(self, job_id: str) -> Iterator[asyncio.Event]:
+        """An event set when this process finishes ``job_id``.
+
+        Enter it before reading the job's status, so a job finishing in between
+        still sets the event. Leaving only drops the event once its last watcher
+        is gone, so one timed-out request does not strand the others.
+        """
+        watch = self._finished.get(job_id)
+        if watch is None:
+            watch = self._finished[job_id] = _Watch()
+        watch.watchers += 1
+        try:
+            yield watch.event
+        finally:
+            watch.watchers -= 1
+            if watch.watchers == 0 and self._finished.get(job_id) is watch:
+                del self._finished[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+            "workers": len(self._workers),
+            **asdict(self.metrics),
+        }
+
+    async def _recover(self) -> None:
+        """Requeue jobs left behind by a restart, including ones a dead worker was running."""
+        stale = datetime.utcnow() - timedelta(seconds=settings.EXPORT_STALE_AFTER_SECONDS)
+        async with async_session_factory() as session:
+            await session.execute(
+                update(ExportJob)
+                .where(ExportJob.status == ExportStatusEnum.RUNNING, ExportJob.started_at < stale)
+                .values(status=ExportStatusEnum.QUEUED)
+            )
+            result = await session.execute(
+                select(ExportJob.id)
+                .where(ExportJob.status == ExportStatusEnum.QUEUED)
+                .order_by(ExportJob.created_at)
+            )
+            pending = result.scalars().all()
+            await session.commit()
+        for job_id in pending:
+            self.enqueue(job_id)
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            job_id = await self._queue.get()
+            self._running += 1
+            try:
+                await self._process(job_id)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Export job %s crashed", job_id)
+            finally:
+                self._running -= 1
+                self._queue.task_done()
+
+    async def _process(self, job_id: str) -> None:
+        async with async_session_factory() as session:
+            now = datetime.utcnow()
+            claimed = await session.execute(
+                update(ExportJob)
+                .where(ExportJob.id == job_id, ExportJob.status == ExportStatusEnum.QUEUED)
+                .values(status=ExportStatusEnum.RUNNING, started_at=now, attempts=ExportJob.attempts + 1)
+                .returning(ExportJob.attempts, ExportJob.created_at)
+            )
+            row = claimed.one_or_none()
+            await session.commit()
+            if row is None:
+                return  # Another process claimed it or it already finished.
+            if row.attempts == 1:
+                wait_ms = (now - row.created_at).total_seconds() * 1000
+                self.metrics.total_wait_ms += wait_ms
+                self.metrics.max_wait_ms = max(self.metrics.max_wait_ms, wait_ms)
+
+            started = time.perf_counter()
+            try:
+                await self._export(session, job_id)
+            except Exception as exc:  # pylint: disable=broad-except
+                await session.rollback()
+                await self._failed(session, job_id, row.attempts, exc)
+                return
+            run_ms = (time.perf_counter() - started) * 1000
+            self.metrics.total_run_ms += run_ms
+            self.metrics.max_run_ms = max(self.metrics.max_run_ms, run_ms)
+            self.metrics.succeeded += 1
+            self._notify(job_id)
+
+    async def _export(self, session: AsyncSession, job_id: str) -> None:
+        job = await session.get(ExportJob, job_id)
+        if job is None:
+            raise ExportError("Export job no longer exists.")
+        tailoring_ids = job.tailoring_ids or [job.tailoring_id]
+        result = await session.execute(
+            select(ResumeTailoring, JobPosting)
+            .join(JobPosting, JobPosting.id == ResumeTailoring.job_id)
+            .where(ResumeTailoring.id.in_(tailoring_ids), ResumeTailoring.user_id == job.user_id)
+        )
+        found = {tailoring.id: (tailoring, posting) for tailoring, posting in result.all()}
+        user = await session.get(User, job.user_id)
+        if not found or user is None:
+            raise ExportError("Tailoring or job no longer exists.")
+
+        results: List[Dict[str, Any]] = []
+        planned = []
+        for tailoring_id in tailoring_ids:
+            if tailoring_id not in found:
+                results.append(_document_result(tailoring_id, None, error="Tailoring no longer exists."))
+                continue
+            tailoring, posting = found[tailoring_id]
+            suffix = f"{posting.title}_{posting.company}.docx"
+            if job.save_resume:
+                planned.append((tailoring, "resume", f"resume_{suffix}", tailoring.tailored_resume_text))
+            if job.save_cover_letter:
+                planned.append((tailoring, "cover_letter", f"coverletter_{suffix}", tailoring.tailored_coverletter_text))
+
+        contents = await asyncio.gather(*(self._render(text) for *_, text in planned))
+        creds = await credential_manager.credentials_for(user)
+
+        parents = None
+        if job.tailoring_ids is not None:
+            if job.folder_id is None:
+                job.folder_id, job.folder_url = await create_drive_folder(
+                    creds, f"JobFlow export {job.created_at:%Y-%m-%d %H:%M}"
+                )
+                # Keep the folder if a later attempt has to retry the uploads.
+                await session.commit()
+            parents = [job.folder_id]
+
+        documents = [
+            DriveDocument(file_name, DOCX_MIME_TYPE, content, parents)
+            for (_, _, file_name, _), content in zip(planned, contents)
+        ]
+        outcomes = await upload_documents_to_drive(creds, documents, return_exceptions=True)
+        if outcomes and all(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise outcomes[0]
+
+        # Bumps the owner's data version so dashboards pick up the new links.
+        session.info["user_id"] = user.id
+        for (tailoring, kind, _, _), outcome in zip(planned, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("Export job %s: %s upload for %s failed: %s", job_id, kind, tailoring.id, outcome)
+                results.append(_document_result(tailoring.id, kind, error=str(outcome)[:300] or type(outcome).__name__))
+                continue
+            results.append(_document_result(tailoring.id, kind, url=outcome))
+            tailoring.saved_to_drive = True
+            if kind == "resume":
+                tailoring.drive_resume_url = outcome
+            else:
+                tailoring.drive_coverletter_url = outcome
+
+        if job.tailoring_id is not None:
+            links = {entry["kind"]: entry["url"] for entry in results}
+            job.resume_url, job.cover_letter_url = links.get("resume"), links.get("cover_letter")
+        job.documents = results
+        job.status = ExportStatusEnum.SUCCEEDED
+        job.finished_at = job.updated_at = datetime.utcnow()
+        await session.commit()
+
+    async def _render(self, text: str) -> bytes:
+        async with self._render_slots:
+            return await run_in_worker(render_docx, text)
+
+    async def _failed(self, session: AsyncSession, job_id: str, attempts: int, exc: Exception) -> None:
+        retry = _is_retryable(exc) and attempts < settings.EXPORT_MAX_ATTEMPTS
+        values: Dict[str, Any] = {"error": str(exc)[:500] or type(exc).__name__, "updated_at": datetime.utcnow()}
+        if retry:
+            values["status"] = ExportStatusEnum.QUEUED
+        else:
+            values.update(status=ExportStatusEnum.FAILED, finished_at=values["updated_at"])
+        await session.execute(update(ExportJob).where(ExportJob.id == job_id).values(**values))
+        await session.commit()
+
+        if retry:
+            delay = settings.EXPORT_RETRY_BASE_SECONDS * 2 ** (attempts - 1) * random.uniform(0.8, 1.2)
+            logger.warning("Export job %s failed (attempt %d), retrying in %.1fs: %s", job_id, attempts, delay, exc)
+            self.metrics.retries += 1
+            asyncio.get_running_loop().call_later(delay, self.enqueue, job_id)
+        else:
+            logger.error("Export job %s failed after %d attempts: %s", job_id, attempts, exc)
+            self.metrics.failed += 1
+            self._notify(job_id)
+
+    def _notify(self, job_id: str) -> None:
+        watch = self._finished.pop(job_id, None)
+        if watch is not None:
+            watch.event.set()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, (ExportError, MissingGoogleTokensError)):
+        return False
+    from google.auth.exceptions import RefreshError
+    from googleapiclient.errors import HttpError
+
+    if isinstance(exc, RefreshError):
+        return False  # Access was revoked; the user has to sign in again.
+    if isinstance(exc, HttpError):
+        return exc.resp.status == 429 or exc.resp.status >= 500
+    return True
+
+
+def _document_result(
+    tailoring_id: str, kind: Optional[str], url: Optional[str] = None, error: Optional[str] = None
+) -> Dict[str, Any]:
+    return {"tailoring_id": tailoring_id, "kind": kind, "url": url, "error": error}
+
+
+export_queue = ExportQueue()
@@ -1,70 +1,184 @@
 from __future__ import annotations
 
+import asyncio
 import io
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from types import MethodType
-from typing import Optional
+from typing import TYPE_CHECKING, Any, List, Optional
+from urllib.parse import urlencode
 
 import httpx
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseUpload
-from google_auth_oauthlib.flow import Flow
+from jose import JWTError, jwt
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 
+# The Google client libraries are imported where used to keep worker boot fast.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
 settings = get_settings()
 
+_GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# Built Drive clients keyed by refresh token; building one parses the discovery document.
+_drive_clients: TTLCache[str, Any] = TTLCache(
+    maxsize=settings.DRIVE_CLIENT_CACHE_SIZE,
+    ttl=settings.DRIVE_CLIENT_CACHE_TTL_SECONDS,
+)
+
+
+class GoogleOAuthError(RuntimeError):
+    """Raised when Google's token endpoint answers without usable tokens."""
+
+
+@dataclass
+class GoogleTokens:
+    """Result of the authorization-code exchange; mirrors the ``Credentials`` fields auth needs."""
+
+    token: str
+    refresh_token: Optional[str]
+    expiry: datetime
+    id_token: Optional[str]
+
+
+@lru_cache
+def _client_config() -> dict:
+    return {
+        "client_id": settings.GOOGLE_CLIENT_ID,
+        "client_secret": settings.GOOGLE_CLIENT_SECRET,
+        "auth_uri": settings.GOOGLE_AUTH_URI,
+        "token_uri": settings.GOOGLE_TOKEN_URI,
+        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+        "scope": " ".join(settings.GOOGLE_SCOPES),
+    }
+
+
+_http: Optional[httpx.AsyncClient] = None
 
-def _build_flow() -> Flow:
-    flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": settings.GOOGLE_CLIENT_ID,
-                "project_id": "job-application-assistant",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                "redirect_uris": [settings.GOOGLE_REDIRECT_URI],
-                "javascript_origins": [],
-            }
-        },
-        scopes=settings.GOOGLE_SCOPES,
-    )
-    flow.redirect_uri = settings.GOOGLE_REDIRECT_URI
-    return flow
+
+def _http_client() -> httpx.AsyncClient:
+    """One pooled client per worker, so logins reuse TLS connections to Google."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(timeout=15)
+    return _http
+
+
+async def close_http_client() -> None:
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
 
 
 def generate_google_auth_url(state: Optional[str] = None) -> str:
-    flow = _build_flow()
-    auth_url, _ = flow.authorization_url(
-        access_type="offline",
-        prompt="consent",
-        state=state,
+    config = _client_config()
+    params = {
+        "response_type": "code",
+        "client_id": config["client_id"],
+        "redirect_uri": config["redirect_uri"],
+        "scope": config["scope"],
+        "access_type": "offline",
+        "prompt": "consent",
+    }
+    if state:
+        params["state"] = state
+    return f"{config['auth_uri']}?{urlencode(params)}"
+
+
+async def exchange_code_for_tokens(code: str) -> GoogleTokens:
+    config = _client_config()
+    resp = await _http_client().post(
+        config["token_uri"],
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "client_id": config["client_id"],
+            "client_secret": config["client_secret"],
+            "redirect_uri": config["redirect_uri"],
+        },
+    )
+    resp.raise_for_status()
+    payload = resp.json()
+    access_token = payload.get("access_token")
+    if not access_token:
+        raise GoogleOAuthError(payload.get("error_description") or payload.get("error") or "No access token returned.")
+    return GoogleTokens(
+        token=access_token,
+        refresh_token=payload.get("refresh_token"),
+        expiry=datetime.now(timezone.utc) + timedelta(seconds=int(payload.get("expires_in", 3600))),
+        id_token=payload.get("id_token"),
     )
-    return auth_url
 
 
-def exchange_code_for_tokens(code: str) -> Credentials:
-    flow = _build_flow()
-    flow.fetch_token(code=code)
-    return flow.credentials
+def profile_from_id_token(id_token: Optional[str]) -> Optional[dict]:
+    """Read the profile from the ID token's claims, in the shape of the userinfo endpoint.
+
+    The token comes straight from Google's token endpoint over TLS, so OpenID
+    Connect allows using its claims without checking the signature; audience,
+    issuer and expiry are still checked.
+    """
+    if not id_token:
+        return None
+    try:
+        claims = jwt.get_unverified_claims(id_token)
+    except JWTError:
+        return None
+    if (
+        claims.get("aud") != settings.GOOGLE_CLIENT_ID
+        or claims.get("iss") not in _GOOGLE_ISSUERS
+        or float(claims.get("exp", 0)) < time.time()
+        or not claims.get("email")
+    ):
+        return None
+    return {
+        "id": claims.get("sub"),
+        "email": claims["email"],
+        "name": claims.get("name"),
+        "given_name": claims.get("given_name"),
+        "picture": claims.get("picture"),
+    }
 
 
 async def fetch_google_profile(access_token: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {access_token}"},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _http_client().get(
+        settings.GOOGLE_USERINFO_URI,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+@lru_cache
+def _drive_discovery_document() -> str:
+    # Shipped with google-api-python-client, so no network fetch is needed.
+    from googleapiclient.discovery_cache import get_static_doc
+
+    return get_static_doc("drive", "v3")
 
 
 def build_drive_client(creds: Credentials):
-    return build("drive", "v3", credentials=creds)
+    from googleapiclient.discovery import build_from_document
+
+    client_options = {"api_endpoint": settings.GOOGLE_DRIVE_API_ENDPOINT} if settings.GOOGLE_DRIVE_API_ENDPOINT else None
+    return build_from_document(_drive_discovery_document(), credentials=creds, client_options=client_options)
+
+
+def cached_drive_client(creds: Credentials) -> Any:
+    """Reuse the client built earlier for the same refresh token.
+
+    Requests are executed with the caller's credentials, so the cached client
+    never holds on to a stale access token.
+    """
+    drive = _drive_clients.get(creds.refresh_token)
+    if drive is None:
+        drive = build_drive_client(creds)
+        _drive_clients.set(creds.refresh_token, drive)
+    return drive
 
 
 def normalize_expiry(expiry: datetime | None) -> datetime:
@@ -82,11 +196,13 @@ def _google_expiry(expiry: datetime | None) -> datetime | None:
 
 
 def credentials_from_tokens(access_token: str, refresh_token: str, expiry: datetime | None) -> Credentials:
+    from google.oauth2.credentials import Credentials
+
     normalized_expiry = normalize_expiry(expiry)
     creds = Credentials(
         access_token,
         refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
+        token_uri=settings.GOOGLE_TOKEN_URI,
         client_id=settings.GOOGLE_CLIENT_ID,
         client_secret=settings.GOOGLE_CLIENT_SECRET,
         scopes=settings.GOOGLE_SCOPES,
@@ -119,15 +235,62 @@ def _patch_before_request(creds: Credentials) -> None:
     creds.before_request = MethodType(_before_request, creds)
 
 
-def upload_text_document_to_drive(
-    *,
-    creds: Credentials,
-    file_name: str,
-    mime_type: str,
-    content: str,
-) -> str:
-    drive = build_drive_client(creds)
-    media = MediaIoBaseUpload(io.BytesIO(content.encode("utf-8")), mimetype=mime_type)
-    file_metadata = {"name": file_name}
-    created = drive.files().create(body=file_metadata, media_body=media, fields="id, webViewLink").execute()
+DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+
+@dataclass
+class DriveDocument:
+    file_name: str
+    mime_type: str
+    content: bytes
+    parents: Optional[List[str]] = None
+
+
+def _authorized_http(creds: Credentials):
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
+
+    # httplib2 connections are not thread-safe, so each call gets its own.
+    return AuthorizedHttp(creds, http=httplib2.Http())
+
+
+def upload_document_to_drive(*, creds: Credentials, document: DriveDocument, drive: Any = None) -> str:
+    from googleapiclient.http import MediaIoBaseUpload
+
+    drive = drive or build_drive_client(creds)
+    media = MediaIoBaseUpload(io.BytesIO(document.content), mimetype=document.mime_type)
+    file_metadata: dict = {"name": document.file_name}
+    if document.parents:
+        file_metadata["parents"] = document.parents
+    request = drive.files().create(body=file_metadata, media_body=media, fields="id, webViewLink")
+    created = request.execute(http=_authorized_http(creds))
     return created["webViewLink"]
+
+
+async def create_drive_folder(creds: Credentials, name: str) -> tuple[str, str]:
+    """Create a folder in the user's Drive and return its ``(id, webViewLink)``."""
+    drive = cached_drive_client(creds)
+    request = drive.files().create(body={"name": name, "mimeType": DRIVE_FOLDER_MIME_TYPE}, fields="id, webViewLink")
+    created = await asyncio.to_thread(request.execute, http=_authorized_http(creds))
+    return created["id"], created["webViewLink"]
+
+
+async def upload_documents_to_drive(
+    creds: Credentials,
+    documents: List[DriveDocument],
+    *,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Upload ``documents`` in worker threads, at most ``EXPORT_UPLOAD_CONCURRENCY`` at a time.
+
+    Links come back in order; with ``return_exceptions`` a failed upload yields its
+    exception instead of cancelling the rest.
+    """
+    drive = cached_drive_client(creds)
+    slots = asyncio.Semaphore(settings.EXPORT_UPLOAD_CONCURRENCY)
+
+    async def _upload(document: DriveDocument) -> str:
+        async with slots:
+            return await asyncio.to_thread(upload_document_to_drive, creds=creds, document=document, drive=drive)
+
+    return await asyncio.gather(*(_upload(document) for document in documents), return_exceptions=return_exceptions)
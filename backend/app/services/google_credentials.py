@@ -0,0 +1,154 @@
+"""Live Google credentials per user, kept fresh ahead of expiry.
+
+Refreshed access tokens are written back to ``users`` so other workers and
+later requests start from a valid token instead of refreshing again.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.db.session import async_session_factory
+from app.models.models import User
+from app.services.google import credentials_from_tokens, normalize_expiry
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class MissingGoogleTokensError(RuntimeError):
+    """Raised when a user has not granted (or has revoked) Google Drive access."""
+
+
+class GoogleCredentialManager:
+    def __init__(self) -> None:
+        self._live: TTLCache[str, Credentials] = TTLCache(
+            maxsize=settings.DRIVE_CLIENT_CACHE_SIZE,
+            ttl=settings.GOOGLE_TOKEN_ACTIVE_WINDOW_SECONDS,
+        )
+        self._last_active: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def touch(self, user_id: str) -> None:
+        """Mark the user as likely to export soon so the refresher keeps their token warm."""
+        self._last_active[user_id] = time.monotonic()
+
+    async def credentials_for(self, user: User) -> Credentials:
+        """Valid credentials for ``user``, refreshed first if they expire within the margin."""
+        if not user.google_access_token or not user.google_refresh_token:
+            raise MissingGoogleTokensError("User missing Google Drive tokens.")
+        self.touch(user.id)
+
+        async with self._locks[user.id]:
+            creds = self._live.get(user.id)
+            if creds is None or creds.refresh_token != user.google_refresh_token:
+                creds = credentials_from_tokens(
+                    user.google_access_token,
+                    user.google_refresh_token,
+                    user.google_token_expiry,
+                )
+                self._live.set(user.id, creds)
+            if _expires_within(creds, settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS):
+                await self._refresh(user.id, creds)
+        return creds
+
+    async def _refresh(self, user_id: str, creds: Credentials) -> None:
+        from google.auth.transport.requests import Request
+
+        started = time.perf_counter()
+        await asyncio.to_thread(creds.refresh, Request())
+        logger.info("Refreshed Google token for %s in %.0f ms", user_id, (time.perf_counter() - started) * 1000)
+        await persist_tokens(user_id, creds)
+
+    async def refresh_expiring(self) -> int:
+        """Refresh tokens of recently active users that expire within the margin."""
+        cutoff = time.monotonic() - settings.GOOGLE_TOKEN_ACTIVE_WINDOW_SECONDS
+        for user_id, last_active in list(self._last_active.items()):
+            if last_active < cutoff:
+                self._last_active.pop(user_id, None)
+                self._locks.pop(user_id, None)
+        if not self._last_active:
+            return 0
+
+        horizon = datetime.now(timezone.utc) + timedelta(seconds=settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS)
+        async with async_session_factory() as session:
+            result = await session.execute(
+                select(User).where(
+                    User.id.in_(list(self._last_active)),
+                    User.google_refresh_token.is_not(None),
+                    User.google_token_expiry < horizon,
+                )
+            )
+            users = result.scalars().all()
+
+        refreshed = 0
+        for user in users:
+            try:
+                await self.credentials_for(user)
+                refreshed += 1
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Background token refresh failed for %s", user.id, exc_info=True)
+        return refreshed
+
+    def forget(self, user_id: str) -> None:
+        """Drop live credentials after the user signs in again with new tokens."""
+        self._live.pop(user_id)
+        self._last_active.pop(user_id, None)
+
+
+def _expires_within(creds: Credentials, seconds: float) -> bool:
+    if creds.expiry is None:
+        return False
+    return normalize_expiry(creds.expiry) <= datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+async def persist_tokens(user_id: str, creds: Credentials) -> None:
+    """Write a refreshed access token and expiry back to the user row."""
+    values = {
+        "google_access_token": creds.token,
+        "google_token_expiry": normalize_expiry(creds.expiry),
+    }
+    if creds.refresh_token:
+        values["google_refresh_token"] = creds.refresh_token
+    async with async_session_factory() as session:
+        await session.execute(update(User).where(User.id == user_id).values(**values))
+        await session.commit()
+
+
+async def has_drive_tokens(session: AsyncSession, user_id: str) -> bool:
+    """Whether the user has granted Drive access; the cached principal carries no tokens."""
+    result = await session.execute(
+        select(User.id).where(
+            User.id == user_id,
+            User.google_access_token.is_not(None),
+            User.google_refresh_token.is_not(None),
+        )
+    )
+    return result.scalar_one_or_none() is not None
+
+
+credential_manager = GoogleCredentialManager()
+
+
+async def run_token_refresher() -> None:
+    """Background loop started with the app; refreshes tokens before exports need them."""
+    while True:
+        await asyncio.sleep(settings.GOOGLE_TOKEN_REFRESH_INTERVAL_SECONDS)
+        try:
+            await credential_manager.refresh_expiring()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Token refresher iteration failed", exc_info=True)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.config import get_settings
+from app.models.models import JobPosting
+
+settings = get_settings()
+
+_postings = JobPosting.__table__
+
+# Columns sent back to the client; everything except the bookkeeping fields.
+READ_COLUMNS = (
+    _postings.c.id,
+    _postings.c.title,
+    _postings.c.company,
+    _postings.c.location,
+    _postings.c.description,
+    _postings.c.snippet,
+    _postings.c.url,
+    _postings.c.application_link,
+    _postings.c.match_score,
+    _postings.c.work_mode,
+    _postings.c.experience_level,
+    _postings.c.skills,
+    _postings.c.posting_date,
+    _postings.c.company_logo_url,
+)
+
+
+async def insert_job_postings(
+    session: AsyncSession,
+    search_id: str,
+    jobs: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Persist a search's postings in a single statement and return them as plain rows.
+
+    Small and medium batches go through one multi-row ``INSERT ... RETURNING``;
+    batches at or above ``JOB_INGEST_COPY_THRESHOLD`` are streamed with ``COPY``
+    when the asyncpg driver is in use. Neither path touches the ORM identity map.
+    """
+    if not jobs:
+        return []
+
+    rows = [_posting_row(search_id, job) for job in jobs]
+
+    connection = await session.connection()
+    if len(rows) >= settings.JOB_INGEST_COPY_THRESHOLD and connection.dialect.driver == "asyncpg":
+        await _copy_rows(connection, rows)
+        return [{column.name: row[column.name] for column in READ_COLUMNS} for row in rows]
+
+    stmt = insert(_postings).values(rows).returning(*READ_COLUMNS)
+    result = await connection.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+def posting_url_key(url: Optional[str]) -> Optional[str]:
+    """Comparable form of a posting URL, or ``None`` when it cannot identify a posting."""
+    parts = urlsplit((url or "").strip())
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def _posting_row(search_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    # Defaults normally filled by SQLModel's default_factory must be set here,
+    # since Core inserts bypass model construction.
+    now = datetime.utcnow()
+    url = job["url"] or job.get("application_link") or ""
+    return {
+        "id": str(uuid4()),
+        "search_id": search_id,
+        "title": job["title"],
+        "company": job["company"],
+        "location": job["location"],
+        "description": job["description"],
+        "snippet": job.get("snippet"),
+        "url": url,
+        "url_key": posting_url_key(url),
+        "application_link": job.get("application_link"),
+        "match_score": job["match_score"],
+        "work_mode": job.get("work_mode"),
+        "experience_level": str(job.get("experience_level")) if job.get("experience_level") else None,
+        "skills": job.get("skills"),
+        "posting_date": job.get("posting_date"),
+        "company_logo_url": job.get("company_logo_url"),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def _copy_rows(connection: AsyncConnection, rows: List[Dict[str, Any]]) -> None:
+    raw = await connection.get_raw_connection()
+    columns = list(rows[0].keys())
+    records = [
+        tuple(json.dumps(row[name]) if name == "skills" and row[name] is not None else row[name] for name in columns)
+        for row in rows
+    ]
+    await raw.driver_connection.copy_records_to_table(
+        _postings.name,
+        records=records,
+        columns=columns,
+    )
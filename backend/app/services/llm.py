@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import asyncio
 from functools import lru_cache
-from typing import Any, Dict
-
-from langchain.schema import HumanMessage, SystemMessage
-from langchain_community.chat_models import ChatOllama
+from typing import TYPE_CHECKING, Any, Dict
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from langchain_community.chat_models import ChatOllama
+
 settings = get_settings()
 
 
 @lru_cache
 def _get_client() -> ChatOllama:
+    # LangChain is slow to import; defer it until the first LLM call.
+    from langchain_community.chat_models import ChatOllama
+
     return ChatOllama(
         base_url=settings.OLLAMA_HOST,
         model=settings.OLLAMA_MODEL,
@@ -27,6 +30,8 @@ class LLMUnavailableError(RuntimeError):
 
 async def _invoke(system_prompt: str, user_prompt: str) -> str:
     def _run() -> str:
+        from langchain.schema import HumanMessage, SystemMessage
+
         try:
             response = _get_client().invoke(
                 [
@@ -61,6 +66,10 @@ async def extract_resume_insights(resume_text: str) -> Dict[str, Any]:
         }
 
 
+# Bump when the scoring prompt changes; stored scores from older prompts are recomputed.
+SCORE_PROMPT_VERSION = "1"
+
+
 async def score_job_match(resume_text: str, job_description: str) -> float:
     prompt = (
         "Compare the user's resume and the job description. Return only a number between 0 and 100 "
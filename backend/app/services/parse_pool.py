@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from app.core.config import get_settings
+from app.services.parser import extract_pdf_pages, extract_text, pdf_page_count
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# How often a queued parse checks whether a worker has started on it.
+_START_POLL_SECONDS = 0.05
+
+
+class ResumeParseError(RuntimeError):
+    """Raised when a resume cannot be parsed within the configured limits."""
+
+
+class ParserBusyError(RuntimeError):
+    """Raised when too many uploads are already waiting for a parser worker."""
+
+
+@dataclass
+class ParseMetrics:
+    parsed: int = 0
+    pages: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+metrics = ParseMetrics()
+
+_executor: Optional[ProcessPoolExecutor] = None
+# Pools whose workers were killed on purpose; calls that fail with them are resubmitted.
+_recycled: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+_slots: Optional[asyncio.Semaphore] = None
+_waiting = 0
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn keeps workers from inheriting the event loop and DB connections.
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PARSER_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _get_slots() -> asyncio.Semaphore:
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.PARSER_MAX_WORKERS)
+    return _slots
+
+
+def _replace_executor(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next caller starts a fresh one.
+
+    Every caller that saw the breakage ends up here; only the first one, while
+    ``broken`` is still current, replaces it, so a late caller cannot shut down
+    the pool that replaced it.
+    """
+    global _executor
+    if _executor is not broken:
+        return
+    _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _recycle_executor(stuck: ProcessPoolExecutor) -> None:
+    """Kill the workers of ``stuck`` and let the next caller start a fresh pool.
+
+    A call that is already running cannot be cancelled, so this is the only way
+    to get a timed-out worker back. Other calls queued or running on ``stuck``
+    fail with ``BrokenProcessPool`` and are resubmitted by ``_call``.
+    """
+    global _executor
+    if _executor is stuck:
+        _executor = None
+    _recycled.add(stuck)
+    # ProcessPoolExecutor has no public way to stop its workers before Python 3.14.
+    for process in list((stuck._processes or {}).values()):  # pylint: disable=protected-access
+        process.terminate()
+    stuck.shutdown(wait=False)
+    logger.warning("Killed parser workers stuck past the timeout.")
+
+
+def shutdown_parse_pool(wait: bool = False) -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+        _executor = None
+
+
+async def _call(
+    func: Callable[..., T], args: Tuple[Any, ...], calls: Optional[List[Tuple[ProcessPoolExecutor, Future]]] = None
+) -> T:
+    """Run ``func`` in the shared pool, resubmitting it if another parse's timeout recycled the pool."""
+    while True:
+        executor = _get_executor()
+        future = executor.submit(func, *args)
+        if calls is not None:
+            calls.append((executor, future))
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            if executor not in _recycled:
+                _replace_executor(executor)
+                raise
+
+
+async def run_in_worker(func: Callable[..., T], *args: Any) -> T:
+    """Run a picklable, CPU-bound ``func`` in the shared worker processes."""
+    return await _call(func, args)
+
+
+class _ParseRun:
+    """The worker calls of one parse, so a timeout stops only its own work."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[ProcessPoolExecutor, Future]] = []
+        self.tasks: List[asyncio.Future] = []
+        self.started_at: Optional[float] = None
+
+    def submit(self, func: Callable[..., T], *args: Any) -> "asyncio.Future[T]":
+        task = asyncio.ensure_future(_call(func, args, self.calls))
+        self.tasks.append(task)
+        return task
+
+    def started(self) -> bool:
+        """Whether a worker has picked up any of this parse's calls yet."""
+        if self.started_at is None and any(future.running() or future.done() for _, future in self.calls):
+            self.started_at = time.monotonic()
+        return self.started_at is not None
+
+    def cancel(self) -> None:
+        # Cancelling the task also cancels its call if no worker has picked it up.
+        for task in self.tasks:
+            task.cancel()
+
+    def kill(self) -> None:
+        """Cancel this parse's calls and kill the workers still running them.
+
+        The tasks are cancelled first, so the killed calls are not resubmitted.
+        """
+        stuck = {executor for executor, future in self.calls if future.running()}
+        self.cancel()
+        for executor in stuck:
+            _recycle_executor(executor)
+
+
+def check_file_limits(path: Path) -> None:
+    size_mb = path.stat().st_size / (1024 * 1024)
+    if size_mb > settings.PARSER_MAX_FILE_MB:
+        raise ResumeParseError(f"File is larger than {settings.PARSER_MAX_FILE_MB} MB.")
+
+
+async def parse_resume(path: Path) -> str:
+    """Extract text in a worker process, queueing behind at most ``PARSER_MAX_QUEUE`` uploads.
+
+    An upload that has not reached a worker within ``PARSER_MAX_QUEUE_WAIT_SECONDS`` is rejected as busy.
+    """
+    global _waiting
+    check_file_limits(path)
+    if _waiting >= settings.PARSER_MAX_QUEUE:
+        metrics.rejected += 1
+        raise ParserBusyError("Resume parser is busy, please retry shortly.")
+
+    queued_until = time.monotonic() + settings.PARSER_MAX_QUEUE_WAIT_SECONDS
+    slots = _get_slots()
+    _waiting += 1
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=settings.PARSER_MAX_QUEUE_WAIT_SECONDS)
+    except asyncio.TimeoutError as exc:
+        metrics.rejected += 1
+        raise ParserBusyError("Resume parser is busy, please retry shortly.") from exc
+    finally:
+        _waiting -= 1
+    try:
+        return await _run(path, queued_until)
+    finally:
+        slots.release()
+
+
+async def iter_resume_text(path: Path, run: Optional[_ParseRun] = None) -> AsyncIterator[str]:
+    """Yield extracted text in document order until ``PARSER_MAX_CHARS`` is reached.
+
+    PDFs are split into ``PARSER_PDF_CHUNK_PAGES``-page chunks. Up to
+    ``PARSER_PDF_PARALLEL_CHUNKS`` of them run at once in separate workers, so
+    only a window of pages is ever in memory.
+    """
+    run = run or _ParseRun()
+    budget = settings.PARSER_MAX_CHARS
+    if path.suffix.lower() != ".pdf":
+        yield await run.submit(extract_text, path, None, budget)
+        return
+
+    pages = min(await run.submit(pdf_page_count, path), settings.PARSER_MAX_PDF_PAGES)
+    chunk = settings.PARSER_PDF_CHUNK_PAGES
+    starts = iter(range(0, pages, chunk))
+    pending: Deque[tuple[asyncio.Future, int]] = deque()
+
+    def submit() -> None:
+        start = next(starts, None)
+        if start is not None:
+            stop = min(start + chunk, pages)
+            pending.append((run.submit(extract_pdf_pages, path, start, stop, budget), stop - start))
+
+    for _ in range(settings.PARSER_PDF_PARALLEL_CHUNKS):
+        submit()
+    try:
+        while pending and budget > 0:
+            future, page_count = pending.popleft()
+            text = (await future)[:budget]
+            metrics.pages += page_count
+            budget -= len(text) + 1
+            yield text
+            submit()
+    finally:
+        for future, _ in pending:
+            future.cancel()
+
+
+async def _collect(path: Path, run: _ParseRun) -> str:
+    return "\n".join([text async for text in iter_resume_text(path, run)])
+
+
+async def _within_timeout(task: "asyncio.Task[str]", run: _ParseRun, queued_until: float) -> str:
+    """Await ``task``, counting ``PARSER_TIMEOUT_SECONDS`` from when a worker starts on it.
+
+    Time spent queued behind other calls in the shared pool does not count, but
+    the parse gives up as busy if no worker has started on it by ``queued_until``.
+    """
+    while not task.done() and not run.started():
+        if time.monotonic() >= queued_until:
+            raise ParserBusyError("Resume parser is busy, please retry shortly.")
+        await asyncio.wait({task}, timeout=_START_POLL_SECONDS)
+    elapsed = time.monotonic() - run.started_at if run.started_at is not None else 0.0
+    return await asyncio.wait_for(task, timeout=max(settings.PARSER_TIMEOUT_SECONDS - elapsed, 0))
+
+
+async def _run(path: Path, queued_until: float) -> str:
+    started = time.perf_counter()
+    run = _ParseRun()
+    task = asyncio.ensure_future(_collect(path, run))
+    try:
+        text = await _within_timeout(task, run, queued_until)
+    except ParserBusyError:
+        metrics.rejected += 1
+        run.cancel()
+        raise
+    except asyncio.TimeoutError as exc:
+        metrics.timeouts += 1
+        run.kill()
+        raise ResumeParseError(f"Parsing took longer than {settings.PARSER_TIMEOUT_SECONDS:.0f}s.") from exc
+    except BrokenProcessPool as exc:
+        metrics.failed += 1
+        raise ResumeParseError("Parser worker crashed.") from exc
+    except Exception as exc:  # pylint: disable=broad-except
+        metrics.failed += 1
+        run.cancel()
+        raise ResumeParseError("Unable to read this file.") from exc
+    finally:
+        if not task.done():
+            task.cancel()
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    metrics.parsed += 1
+    metrics.total_ms += elapsed_ms
+    metrics.max_ms = max(metrics.max_ms, elapsed_ms)
+    logger.info("Parsed %s in %.0f ms", path.name, elapsed_ms)
+    return text
+
+
+def parse_stats() -> Dict[str, Any]:
+    return {"waiting": _waiting, "workers": settings.PARSER_MAX_WORKERS, **asdict(metrics)}
@@ -1,47 +1,95 @@
 from __future__ import annotations
 
+import hashlib
 import uuid
 from pathlib import Path
 
 import aiofiles
 from fastapi import UploadFile
-from pypdf import PdfReader
-from docx import Document
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# Bump when extraction output changes so cached parse results are not reused.
+PARSER_VERSION = "1"
 
-async def save_upload_file(upload_file: UploadFile) -> tuple[Path, str]:
-    settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    file_suffix = Path(upload_file.filename or "").suffix or ".bin"
-    unique_name = f"{uuid.uuid4()}{file_suffix}"
-    destination = settings.UPLOAD_DIR / unique_name
 
-    async with aiofiles.open(destination, "wb") as out_file:
-        while chunk := await upload_file.read(1024 * 1024):
-            await out_file.write(chunk)
+def parser_version() -> str:
+    return f"{PARSER_VERSION}-p{settings.PARSER_MAX_PDF_PAGES}-c{settings.PARSER_MAX_CHARS}"
 
-    original_name = upload_file.filename or unique_name
-    await upload_file.close()
-    return destination, original_name
 
+def content_key(content_hash: str, suffix: str) -> str:
+    """Storage key for uploaded bytes; identical uploads share one key."""
+    return f"{content_hash[:2]}/{content_hash}{suffix}"
 
-def extract_text(file_path: Path) -> str:
+
+async def save_upload_file(upload_file: UploadFile) -> tuple[Path, str, str]:
+    """Stream an upload to a temporary file, hashing it on the way.
+
+    Returns ``(temp_path, original_name, content_hash)``. The caller hands the
+    file to the storage backend once it has been parsed.
+    """
+    temp_dir = settings.UPLOAD_DIR / "tmp"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    file_suffix = (Path(upload_file.filename or "").suffix or ".bin").lower()
+    temp_path = temp_dir / f"{uuid.uuid4()}{file_suffix}"
+    digest = hashlib.sha256()
+
+    try:
+        async with aiofiles.open(temp_path, "wb") as out_file:
+            while chunk := await upload_file.read(1024 * 1024):
+                digest.update(chunk)
+                await out_file.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        await upload_file.close()
+
+    content_hash = digest.hexdigest()
+    original_name = upload_file.filename or f"{content_hash}{file_suffix}"
+    return temp_path, original_name, content_hash
+
+
+def extract_text(file_path: Path, max_pages: int | None = None, max_chars: int | None = None) -> str:
     suffix = file_path.suffix.lower()
     if suffix == ".pdf":
-        return _extract_pdf(file_path)
-    if suffix in {".docx", ".doc"}:
-        return _extract_docx(file_path)
-    return file_path.read_text(encoding="utf-8", errors="ignore")
+        text = extract_pdf_pages(file_path, 0, max_pages, max_chars)
+    elif suffix in {".docx", ".doc"}:
+        text = _extract_docx(file_path)
+    else:
+        text = file_path.read_text(encoding="utf-8", errors="ignore")
+    return text[:max_chars] if max_chars is not None else text
 
 
-def _extract_pdf(path: Path) -> str:
+def pdf_page_count(path: Path) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(path).pages)
+
+
+def extract_pdf_pages(path: Path, start: int, stop: int | None, max_chars: int | None = None) -> str:
+    """Text of pages ``start:stop``, stopping early once ``max_chars`` is reached.
+
+    Pages are parsed lazily by pypdf, so memory follows the pages read, not the file.
+    """
+    from pypdf import PdfReader
+
     reader = PdfReader(path)
-    return "\n".join(page.extract_text() or "" for page in reader.pages)
+    parts: list[str] = []
+    total = 0
+    for page in reader.pages[start:stop]:
+        text = page.extract_text() or ""
+        parts.append(text)
+        total += len(text) + 1
+        if max_chars is not None and total >= max_chars:
+            break
+    return "\n".join(parts)
 
 
 def _extract_docx(path: Path) -> str:
+    from docx import Document
+
     document = Document(path)
     return "\n".join(paragraph.text for paragraph in document.paragraphs)
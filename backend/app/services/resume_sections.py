@@ -0,0 +1,195 @@
+"""Section-aware index over extracted resume text.
+
+The index stores character offsets into ``parsed_text`` rather than copies of it:
+
+    {"version": 1,
+     "sections": [{"name", "heading", "start", "end", "bullets": [[start, end], ...],
+                   "dates": [{"from", "to", "start", "end"}, ...]}, ...],
+     "skills": [{"name", "start", "end"}, ...]}
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+INDEX_VERSION = 1
+
+# Sections worth sending when the LLM judges fit rather than rewriting the whole resume.
+MATCHING_SECTIONS = ("summary", "experience", "projects", "skills")
+# Cover letters also need the header: the candidate's name and contact details sign the letter.
+COVER_LETTER_SECTIONS = ("header", *MATCHING_SECTIONS)
+
+_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "about me", "objective", "career objective"),
+    "experience": (
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment",
+        "employment history",
+        "work history",
+    ),
+    "education": ("education", "academic background", "education and training"),
+    "skills": ("skills", "technical skills", "core competencies", "key skills", "technologies", "tools"),
+    "projects": ("projects", "selected projects", "personal projects"),
+    "certifications": ("certifications", "certificates", "licenses and certifications"),
+    "awards": ("awards", "honors", "achievements"),
+    "publications": ("publications",),
+    "languages": ("languages",),
+    "volunteering": ("volunteer experience", "volunteering"),
+}
+_HEADING_LOOKUP = {alias: name for name, aliases in _HEADINGS.items() for alias in aliases}
+
+_SKILL_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "py": "python",
+    "golang": "go",
+}
+
+_BULLET = re.compile(r"^\s*(?:[-*•▪●◦‣–]|\d{1,2}[.)])\s+")
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+)?(?:19|20)\d{{2}}|\d{{1,2}}/(?:19|20)\d{{2}}"
+_DATE_RANGE = re.compile(
+    rf"(?P<from>{_DATE})\s*(?:-|–|—|to)\s*(?P<to>{_DATE}|present|current|now)",
+    re.IGNORECASE,
+)
+_SKILL_SPLIT = re.compile(r"[,;|•·]")
+
+
+def _heading_name(line: str, allow_generic: bool) -> Optional[str]:
+    cleaned = re.sub(r"[^a-z& ]", "", line.strip().rstrip(":").lower()).replace("&", "and")
+    cleaned = " ".join(cleaned.split())
+    if not cleaned or len(cleaned) > 40:
+        return None
+    if cleaned in _HEADING_LOOKUP:
+        return _HEADING_LOOKUP[cleaned]
+    stripped = line.strip().rstrip(":")
+    if allow_generic and stripped.isupper() and len(stripped.split()) <= 4 and not _DATE_RANGE.search(stripped):
+        return cleaned.replace(" ", "_")
+    return None
+
+
+def build_index(text: str) -> Dict[str, Any]:
+    """Split ``text`` into sections by heading and collect bullets, date ranges and skills."""
+    sections: List[Dict[str, Any]] = []
+    current: Dict[str, Any] = {"name": "header", "heading": None, "start": 0, "bullets": [], "dates": []}
+    offset = 0
+
+    for line in text.splitlines(keepends=True):
+        content = line.rstrip("\r\n")
+        # Unknown all-caps lines only count as headings after a known one, so a
+        # name in capitals at the top stays part of the header.
+        name = _heading_name(content, allow_generic=current["heading"] is not None) if content.strip() else None
+        if name is not None:
+            current["end"] = offset
+            sections.append(current)
+            current = {
+                "name": name,
+                "heading": content.strip(),
+                "start": offset + len(line),
+                "bullets": [],
+                "dates": [],
+            }
+        else:
+            bullet = _BULLET.match(content)
+            if bullet:
+                current["bullets"].append([offset + bullet.end(), offset + len(content)])
+            for match in _DATE_RANGE.finditer(content):
+                current["dates"].append(
+                    {
+                        "from": match.group("from"),
+                        "to": match.group("to"),
+                        "start": offset + match.start(),
+                        "end": offset + match.end(),
+                    }
+                )
+        offset += len(line)
+
+    current["end"] = offset
+    sections.append(current)
+    sections = [section for section in sections if section["heading"] or text[section["start"] : section["end"]].strip()]
+
+    skills: List[Dict[str, Any]] = []
+    for section in sections:
+        if section["name"] == "skills":
+            skills.extend(_skills(text, section["start"], section["end"]))
+    return {"version": INDEX_VERSION, "sections": sections, "skills": _dedupe(skills)}
+
+
+def _skills(text: str, start: int, end: int) -> Iterable[Dict[str, Any]]:
+    offset = start
+    for line in text[start:end].splitlines(keepends=True):
+        body_start = 0
+        bullet = _BULLET.match(line)
+        if bullet:
+            body_start = bullet.end()
+        # "Languages: Python, Go" -> drop the category label.
+        label, colon, _ = line.partition(":")
+        if colon and len(label.split()) <= 3:
+            body_start = max(body_start, len(label) + 1)
+
+        position = body_start
+        for token in _SKILL_SPLIT.split(line[body_start:]):
+            stripped = token.strip()
+            if 1 < len(stripped) <= 40:
+                token_start = offset + position + token.index(stripped)
+                normalized = " ".join(stripped.lower().split())
+                yield {
+                    "name": _SKILL_ALIASES.get(normalized, normalized),
+                    "start": token_start,
+                    "end": token_start + len(stripped),
+                }
+            position += len(token) + 1
+        offset += len(line)
+
+
+def _dedupe(skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = set()
+    unique = []
+    for skill in skills:
+        if skill["name"] not in seen:
+            seen.add(skill["name"])
+            unique.append(skill)
+    return unique
+
+
+def find_section(index: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    return next((section for section in index["sections"] if section["name"] == name), None)
+
+
+def section_text(text: str, index: Dict[str, Any], names: Iterable[str]) -> str:
+    """Concatenate the named sections (with their headings) in document order.
+
+    Falls back to the whole text when none of them were detected.
+    """
+    wanted = set(names)
+    parts = [
+        "\n".join(
+            part
+            for part in (section["heading"], text[section["start"] : section["end"]].strip())
+            if part
+        )
+        for section in index["sections"]
+        if section["name"] in wanted
+    ]
+    return "\n\n".join(parts) if parts else text
+
+
+def resume_index(text: str, stored: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Use the index persisted at upload time unless it predates ``INDEX_VERSION``."""
+    if stored and stored.get("version") == INDEX_VERSION:
+        return stored
+    return build_index(text)
+
+
+def matching_text(text: str, stored: Optional[Dict[str, Any]]) -> str:
+    """The parts of a resume that matter for scoring fit or drafting a cover letter."""
+    return section_text(text, resume_index(text, stored), MATCHING_SECTIONS)
+
+
+def cover_letter_text(text: str, stored: Optional[Dict[str, Any]]) -> str:
+    """The matching sections plus the header, so the letter can be signed and addressed."""
+    return section_text(text, resume_index(text, stored), COVER_LETTER_SECTIONS)
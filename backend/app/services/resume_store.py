@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import exists, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import ResumeFile, ResumeParseResult
+from app.services.parser import parser_version
+from app.services.storage import resolve
+
+
+async def cached_parse(session: AsyncSession, content_hash: str) -> Optional[str]:
+    """Text previously extracted from these bytes by the current parser, if any."""
+    result = await session.execute(
+        select(ResumeParseResult.parsed_text).where(
+            ResumeParseResult.content_hash == content_hash,
+            ResumeParseResult.parser_version == parser_version(),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def remember_parse(session: AsyncSession, content_hash: str, parsed_text: str) -> None:
+    await session.execute(
+        insert(ResumeParseResult.__table__)
+        .values(
+            content_hash=content_hash,
+            parser_version=parser_version(),
+            parsed_text=parsed_text,
+            created_at=datetime.utcnow(),
+        )
+        .on_conflict_do_nothing(index_elements=["content_hash", "parser_version"])
+    )
+
+
+async def lock_file(session: AsyncSession, file_url: str) -> None:
+    """Serialize writers and deleters of one stored file until this transaction ends.
+
+    An upload holds it from ``put`` until its row commits and a release holds it
+    while checking references and deleting, so a release can never remove a file
+    that an upload of the same bytes is about to point at.
+    """
+    await session.execute(text("SELECT pg_advisory_xact_lock(hashtextextended(:name, 0))"), {"name": file_url})
+
+
+async def release_file(session: AsyncSession, file_url: str) -> None:
+    """Delete a stored upload once no resume refers to it any more. Commits the session."""
+    await lock_file(session, file_url)
+    referenced = await session.scalar(select(exists().where(ResumeFile.file_url == file_url)))
+    if not referenced:
+        backend, key = resolve(file_url)
+        await backend.delete(key)
+    await session.commit()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, exists, func, insert, literal, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.models import (
+    ApplicationStatus,
+    JobPosting,
+    JobPostingArchive,
+    JobSearchHistory,
+    ResumeTailoring,
+    User,
+)
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_postings = JobPosting.__table__
+_archive = JobPostingArchive.__table__
+_users = User.__table__
+_PARTITION_NAME = re.compile(r"^job_postings_archive_(\d{4})(\d{2})$")
+
+
+@dataclass
+class RetentionReport:
+    archived: int = 0
+    compacted: int = 0
+    searches_deleted: int = 0
+    partitions_dropped: int = 0
+
+
+def _unreferenced():
+    """No application or tailoring references the posting.
+
+    Repeated in every write so a reference added after the batch was picked keeps its posting.
+    """
+    return (
+        ~exists().where(ApplicationStatus.job_id == _postings.c.id),
+        ~exists().where(ResumeTailoring.job_id == _postings.c.id),
+    )
+
+
+def _untouched_postings(cutoff: datetime):
+    """Postings older than ``cutoff`` that no application or tailoring references."""
+    return select(_postings.c.id).where(_postings.c.created_at < cutoff, *_unreferenced())
+
+
+async def apply_retention(session: AsyncSession, now: Optional[datetime] = None) -> RetentionReport:
+    """Archive or compact stale postings, prune empty searches and drop expired archive partitions.
+
+    Work is committed in batches of ``RETENTION_BATCH_SIZE`` to keep lock times short.
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=settings.RETENTION_POSTING_MAX_AGE_DAYS)
+    report = RetentionReport()
+
+    if settings.RETENTION_MODE == "archive":
+        report.archived = await _archive_postings(session, cutoff)
+    else:
+        report.compacted = await _compact_postings(session, cutoff)
+
+    report.searches_deleted = await _delete_empty_searches(session, cutoff)
+
+    if settings.RETENTION_ARCHIVE_MAX_AGE_DAYS is not None:
+        report.partitions_dropped = await drop_archive_partitions(
+            session, now - timedelta(days=settings.RETENTION_ARCHIVE_MAX_AGE_DAYS)
+        )
+    return report
+
+
+async def _bump_owners(session: AsyncSession, ids: List[str]) -> None:
+    """Bump the owners' data versions; Core writes bypass the ORM hook that usually does it."""
+    owners = (
+        select(JobSearchHistory.user_id)
+        .join(_postings, _postings.c.search_id == JobSearchHistory.id)
+        .where(_postings.c.id.in_(ids))
+    )
+    await session.execute(
+        update(_users).where(_users.c.id.in_(owners)).values(data_version=_users.c.data_version + 1)
+    )
+
+
+async def _archive_postings(session: AsyncSession, cutoff: datetime) -> int:
+    archived = 0
+    columns = [column for column in _postings.c if column.name in _archive.c]
+    while True:
+        ids = (
+            await session.execute(_untouched_postings(cutoff).limit(settings.RETENTION_BATCH_SIZE))
+        ).scalars().all()
+        if not ids:
+            return archived
+
+        if session.bind.dialect.name == "postgresql":
+            bounds = await session.execute(
+                select(func.min(_postings.c.created_at), func.max(_postings.c.created_at)).where(
+                    _postings.c.id.in_(ids)
+                )
+            )
+            await _ensure_partitions(session, *bounds.one())
+
+        await _bump_owners(session, ids)
+        # Delete and copy in one statement, so a posting is archived exactly when it is removed.
+        moved = (
+            delete(_postings)
+            .where(_postings.c.id.in_(ids), *_unreferenced())
+            .returning(*columns)
+            .cte("moved")
+        )
+        result = await session.execute(
+            insert(_archive).from_select(
+                [column.name for column in columns] + ["archived_at"],
+                select(*moved.c, literal(datetime.utcnow()).label("archived_at")),
+            )
+        )
+        await session.commit()
+        archived += result.rowcount or 0
+
+
+async def _compact_postings(session: AsyncSession, cutoff: datetime) -> int:
+    compacted = 0
+    while True:
+        ids = (
+            await session.execute(
+                _untouched_postings(cutoff)
+                .where(_postings.c.description != "")
+                .limit(settings.RETENTION_BATCH_SIZE)
+            )
+        ).scalars().all()
+        if not ids:
+            return compacted
+        await _bump_owners(session, ids)
+        result = await session.execute(
+            update(_postings)
+            .where(_postings.c.id.in_(ids), *_unreferenced())
+            .values(description="", skills=None)
+        )
+        await session.commit()
+        compacted += result.rowcount or 0
+
+
+async def _delete_empty_searches(session: AsyncSession, cutoff: datetime) -> int:
+    result = await session.execute(
+        delete(JobSearchHistory.__table__).where(
+            JobSearchHistory.created_at < cutoff,
+            ~exists().where(_postings.c.search_id == JobSearchHistory.id),
+        )
+    )
+    await session.commit()
+    return result.rowcount or 0
+
+
+def _month_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, 1)
+
+
+def _next_month(moment: datetime) -> datetime:
+    return datetime(moment.year + moment.month // 12, moment.month % 12 + 1, 1)
+
+
+async def _ensure_partitions(session: AsyncSession, earliest: datetime, latest: datetime) -> None:
+    month = _month_start(earliest)
+    while month <= latest:
+        upper = _next_month(month)
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS job_postings_archive_{month:%Y%m} "
+                "PARTITION OF job_postings_archive "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+        month = upper
+
+
+async def _archive_partitions(session: AsyncSession) -> List[str]:
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'job_postings_archive'"
+        )
+    )
+    return [name for name in result.scalars() if _PARTITION_NAME.match(name)]
+
+
+async def drop_archive_partitions(session: AsyncSession, older_than: datetime) -> int:
+    """Detach and drop monthly archive partitions that end before ``older_than``."""
+    if session.bind.dialect.name != "postgresql":
+        return 0
+    dropped = 0
+    for name in await _archive_partitions(session):
+        year, month = (int(part) for part in _PARTITION_NAME.match(name).groups())
+        if _next_month(datetime(year, month, 1)) > older_than:
+            continue
+        await session.execute(text(f"ALTER TABLE job_postings_archive DETACH PARTITION {name}"))
+        await session.execute(text(f"DROP TABLE {name}"))
+        dropped += 1
+        logger.info("Dropped archive partition %s", name)
+    await session.commit()
+    return dropped
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import ApplicationStatus, ApplicationStatusEnum, ApplicationStatusRollup
+
+Bucket = tuple[date, str]
+
+_rollups = ApplicationStatusRollup.__table__
+
+
+def status_bucket(status: ApplicationStatus) -> Bucket:
+    """Day and status an application is counted under on the dashboard."""
+    return (status.applied_at or status.updated_at).date(), ApplicationStatusEnum(status.status).value
+
+
+async def apply_status_change(
+    session: AsyncSession,
+    user_id: str,
+    before: Optional[Bucket],
+    after: Optional[Bucket],
+) -> None:
+    """Move one application between rollup buckets; ``None`` means created or deleted."""
+    if before == after:
+        return
+    if before is not None:
+        day, status = before
+        await session.execute(
+            update(_rollups)
+            .where(_rollups.c.user_id == user_id, _rollups.c.day == day, _rollups.c.status == status)
+            .values(count=_rollups.c.count - 1)
+        )
+        await session.execute(
+            delete(_rollups).where(
+                _rollups.c.user_id == user_id,
+                _rollups.c.day == day,
+                _rollups.c.status == status,
+                _rollups.c.count <= 0,
+            )
+        )
+    if after is not None:
+        day, status = after
+        stmt = insert(_rollups).values(user_id=user_id, day=day, status=status, count=1)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[_rollups.c.user_id, _rollups.c.day, _rollups.c.status],
+                set_={"count": _rollups.c.count + 1},
+            )
+        )
+
+
+async def status_counts(session: AsyncSession, user_id: str) -> Dict[str, int]:
+    result = await session.execute(
+        select(_rollups.c.status, func.sum(_rollups.c.count))
+        .where(_rollups.c.user_id == user_id)
+        .group_by(_rollups.c.status)
+    )
+    return {status: int(total) for status, total in result}
+
+
+async def weekly_counts(session: AsyncSession, user_id: str, weeks: int = 6) -> List[dict]:
+    start = (datetime.utcnow() - timedelta(weeks=weeks)).date()
+    week = func.date_trunc("week", _rollups.c.day).label("week")
+    result = await session.execute(
+        select(week, func.sum(_rollups.c.count))
+        .where(_rollups.c.user_id == user_id, _rollups.c.day >= start)
+        .group_by(week)
+        .order_by(week)
+    )
+    return [{"week": week_start.strftime("%Y-%W"), "count": int(total)} for week_start, total in result]
+
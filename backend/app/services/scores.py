@@ -0,0 +1,149 @@
+"""Match scores per (resume, posting), reused until the resume or the model changes.
+
+Every search stores fresh ``job_postings`` rows, so lookups also match earlier
+postings with the same non-empty URL; re-running a search shows the scores it had
+before.
+
+``parsed_text`` never changes after upload, so the scored text only changes with
+the section extraction; ``INDEX_VERSION`` is part of the stored prompt version.
+Storing a score also clears the resume's rows for any other text digest.
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy import Subquery, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.models import JobPosting, ResumeFile, ResumeJobScore
+from app.services import llm
+from app.services.job_store import posting_url_key
+from app.services.resume_sections import INDEX_VERSION, matching_text
+
+settings = get_settings()
+
+_scores = ResumeJobScore.__table__
+
+
+@dataclass(frozen=True)
+class ScoreKey:
+    resume_id: str
+    user_id: str
+    resume_text: str
+    resume_digest: str
+    model: str
+    prompt_version: str
+
+
+def score_version() -> str:
+    """Prompt and section-extraction versions; a change to either rescores everything."""
+    return f"{llm.SCORE_PROMPT_VERSION}.i{INDEX_VERSION}"
+
+
+def score_key(resume: ResumeFile) -> ScoreKey:
+    text = matching_text(resume.parsed_text, resume.structured_index)
+    return ScoreKey(
+        resume_id=resume.id,
+        user_id=resume.user_id,
+        resume_text=text,
+        resume_digest=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        model=settings.OLLAMA_MODEL,
+        prompt_version=score_version(),
+    )
+
+
+def _current(key: ScoreKey):
+    return (
+        _scores.c.resume_id == key.resume_id,
+        _scores.c.model == key.model,
+        _scores.c.prompt_version == key.prompt_version,
+        _scores.c.resume_digest == key.resume_digest,
+    )
+
+
+async def lookup_scores(session: AsyncSession, key: ScoreKey, postings: Mapping[str, str]) -> Dict[str, float]:
+    """Current scores for ``postings`` (job id -> URL) in one query.
+
+    A posting scored directly wins over another posting with the same URL.
+    Postings without a usable URL only match by id.
+    """
+    if not postings:
+        return {}
+    url_keys = {job_id: posting_url_key(url) for job_id, url in postings.items()}
+    matches = _scores.c.job_id.in_(list(postings))
+    if keys := {url_key for url_key in url_keys.values() if url_key is not None}:
+        matches = or_(matches, JobPosting.url_key.in_(keys))
+    result = await session.execute(
+        select(_scores.c.job_id, JobPosting.url_key, _scores.c.score)
+        .join(JobPosting, JobPosting.id == _scores.c.job_id)
+        .where(*_current(key), matches)
+        .order_by(_scores.c.created_at)
+    )
+    by_id: Dict[str, float] = {}
+    by_url: Dict[str, float] = {}
+    for job_id, url_key, score in result.all():
+        by_id[job_id] = score
+        if url_key is not None:
+            by_url[url_key] = score  # Ordered by age, so the newest score for a URL wins.
+    found: Dict[str, float] = {}
+    for job_id, url_key in url_keys.items():
+        score = by_id.get(job_id)
+        if score is None and url_key is not None:
+            score = by_url.get(url_key)
+        if score is not None:
+            found[job_id] = score
+    return found
+
+
+async def score_posting(session: AsyncSession, key: ScoreKey, job: JobPosting) -> tuple[float, bool]:
+    """The stored score for ``job`` or a fresh one from the LLM; the flag is True on a cache hit.
+
+    The caller commits.
+    """
+    cached: Optional[float] = (await lookup_scores(session, key, {job.id: job.url})).get(job.id)
+    if cached is not None:
+        return cached, True
+    score = await llm.score_job_match(key.resume_text, job.description)
+    await store_score(session, key, job.id, score)
+    return score, False
+
+
+async def store_score(session: AsyncSession, key: ScoreKey, job_id: str, score: float) -> None:
+    values = {
+        "user_id": key.user_id,
+        "score": score,
+        "model": key.model,
+        "prompt_version": key.prompt_version,
+        "resume_digest": key.resume_digest,
+        "created_at": datetime.utcnow(),
+    }
+    # Scores of an earlier version of this resume's text no longer describe it.
+    await session.execute(
+        delete(_scores).where(_scores.c.resume_id == key.resume_id, _scores.c.resume_digest != key.resume_digest)
+    )
+    await session.execute(
+        insert(_scores)
+        .values(resume_id=key.resume_id, job_id=job_id, **values)
+        .on_conflict_do_update(index_elements=["resume_id", "job_id"], set_=values)
+    )
+
+
+def best_scores(user_id: str, job_id: Optional[str] = None) -> Subquery:
+    """Each posting's highest current score across the user's resumes, for joining into listings."""
+    stmt = (
+        select(_scores.c.job_id, func.max(_scores.c.score).label("score"))
+        .where(
+            _scores.c.user_id == user_id,
+            _scores.c.model == settings.OLLAMA_MODEL,
+            _scores.c.prompt_version == score_version(),
+        )
+        .group_by(_scores.c.job_id)
+    )
+    if job_id is not None:
+        stmt = stmt.where(_scores.c.job_id == job_id)
+    return stmt.subquery()
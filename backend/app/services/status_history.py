@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, exists, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.models import (
+    ApplicationStatus,
+    ApplicationStatusEnum,
+    ApplicationStatusEvent,
+    UserStatusSeries,
+)
+
+DAY_FORMAT = "%Y-%m-%d"
+WEEK_FORMAT = "%Y-%W"
+
+
+def _status_value(status: Optional[str]) -> Optional[str]:
+    return ApplicationStatusEnum(status).value if status is not None else None
+
+
+async def record_transition(
+    session: AsyncSession,
+    user_id: str,
+    job_id: str,
+    from_status: Optional[str],
+    to_status: Optional[str],
+) -> None:
+    """Append a status change to the log and fold it into the user's series snapshot.
+
+    ``from_status=None`` marks a newly tracked job, ``to_status=None`` a removed one.
+    """
+    from_status, to_status = _status_value(from_status), _status_value(to_status)
+    if from_status == to_status:
+        return
+
+    event = ApplicationStatusEvent(
+        user_id=user_id,
+        job_id=job_id,
+        from_status=from_status,
+        to_status=to_status,
+    )
+    session.add(event)
+
+    series = await _locked_series(session, user_id)
+    series.daily = _fold(series.daily, [event], DAY_FORMAT)
+    series.weekly = _fold(series.weekly, [event], WEEK_FORMAT)
+    series.updated_at = event.occurred_at
+
+
+async def _locked_series(session: AsyncSession, user_id: str) -> UserStatusSeries:
+    # Concurrent writes for one user serialize on the snapshot row.
+    await session.execute(
+        insert(UserStatusSeries.__table__)
+        .values(user_id=user_id, daily={}, weekly={}, updated_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+    result = await session.execute(
+        select(UserStatusSeries)
+        .where(UserStatusSeries.user_id == user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+def _fold(series: dict, events: List[ApplicationStatusEvent], label_format: str) -> dict:
+    """Return a new series with ``events`` (in time order) applied as cumulative deltas."""
+    labels: List[str] = list(series.get("labels", []))
+    columns: Dict[str, List[int]] = {status: list(values) for status, values in series.get("columns", {}).items()}
+
+    for event in events:
+        label = event.occurred_at.strftime(label_format)
+        if not labels or labels[-1] < label:
+            labels.append(label)
+            for values in columns.values():
+                values.append(values[-1])
+        for status, delta in ((event.from_status, -1), (event.to_status, 1)):
+            if status is None:
+                continue
+            values = columns.setdefault(status, [0] * len(labels))
+            values[-1] += delta
+
+    return {"labels": labels, "columns": columns}
+
+
+def series_points(series: Optional[dict], label_key: str) -> List[dict]:
+    """Convert a columnar series into the row-per-point shape the dashboard charts use."""
+    if not series:
+        return []
+    columns = series.get("columns", {})
+    return [
+        {label_key: label, **{status: values[index] for status, values in columns.items()}}
+        for index, label in enumerate(series.get("labels", []))
+    ]
+
+
+async def rebuild_series(session: AsyncSession, user_id: str) -> UserStatusSeries:
+    """Recompute a user's snapshot from the full event log."""
+    result = await session.execute(
+        select(ApplicationStatusEvent)
+        .where(ApplicationStatusEvent.user_id == user_id)
+        # A backfilled creation event can share its timestamp with the first change.
+        .order_by(ApplicationStatusEvent.occurred_at, ApplicationStatusEvent.from_status.is_not(None))
+    )
+    events = list(result.scalars())
+    series = await _locked_series(session, user_id)
+    series.daily = _fold({}, events, DAY_FORMAT)
+    series.weekly = _fold({}, events, WEEK_FORMAT)
+    series.updated_at = datetime.utcnow()
+    return series
+
+
+async def backfill_status_events(session: AsyncSession) -> int:
+    """Seed creation events for applications tracked before the log existed and rebuild every snapshot.
+
+    An application created before the log and changed after it only has from->to
+    events; its creation event starts in the first event's ``from_status``.
+    Returns the number of synthesized events. Safe to run more than once.
+    """
+    created_event = aliased(ApplicationStatusEvent)
+
+    def without_creation(model):  # noqa: ANN001
+        return ~exists().where(
+            and_(
+                created_event.user_id == model.user_id,
+                created_event.job_id == model.job_id,
+                created_event.from_status.is_(None),
+            )
+        )
+
+    orphaned = await session.execute(
+        select(ApplicationStatusEvent)
+        .where(without_creation(ApplicationStatusEvent))
+        .order_by(ApplicationStatusEvent.occurred_at.desc())
+    )
+    # Descending, so the earliest event per job is the one left in the dict.
+    earliest = {(event.user_id, event.job_id): event for event in orphaned.scalars()}
+    untracked = await session.execute(select(ApplicationStatus).where(without_creation(ApplicationStatus)))
+    applications = {(status.user_id, status.job_id): status for status in untracked.scalars()}
+
+    created = 0
+    for user_id, job_id in earliest.keys() | applications.keys():
+        first = earliest.get((user_id, job_id))
+        application = applications.get((user_id, job_id))
+        tracked_at = (application.applied_at or application.created_at) if application else None
+        if first is not None:
+            to_status = first.from_status
+            occurred_at = min(tracked_at, first.occurred_at) if tracked_at else first.occurred_at
+        else:
+            to_status = _status_value(application.status)
+            occurred_at = tracked_at
+        session.add(
+            ApplicationStatusEvent(
+                user_id=user_id,
+                job_id=job_id,
+                from_status=None,
+                to_status=to_status,
+                occurred_at=occurred_at,
+            )
+        )
+        created += 1
+    await session.flush()
+
+    users = await session.execute(select(ApplicationStatusEvent.user_id).distinct())
+    for user_id in users.scalars().all():
+        await rebuild_series(session, user_id)
+    await session.commit()
+    return created
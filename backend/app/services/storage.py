@@ -0,0 +1,148 @@
+"""Where uploaded files live once they have been hashed.
+
+``ResumeFile.file_url`` stores ``local://<key>`` or ``s3://<bucket>/<key>``. Rows
+written before the storage backends existed hold a plain filesystem path and
+are served from disk.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from app.core.config import get_settings
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+settings = get_settings()
+
+LOCAL_SCHEME = "local://"
+S3_SCHEME = "s3://"
+
+
+class StorageBackend(ABC):
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        """The value stored in ``ResumeFile.file_url`` for ``key``."""
+
+    @abstractmethod
+    async def put(self, key: str, source: Path) -> None:
+        """Move ``source`` into storage under ``key``; existing content is kept as is."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """A path that can be served straight from disk, if the backend has one."""
+        return None
+
+    async def presigned_url(self, key: str, filename: str, media_type: str) -> Optional[str]:
+        """A time-limited URL the client can fetch ``key`` from directly, if supported."""
+        return None
+
+
+class LocalStorage(StorageBackend):
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def url_for(self, key: str) -> str:
+        return f"{LOCAL_SCHEME}{key}"
+
+    def local_path(self, key: str) -> Path:
+        return self.root / key
+
+    async def put(self, key: str, source: Path) -> None:
+        destination = self.local_path(key)
+        if destination.exists():
+            source.unlink(missing_ok=True)
+            return
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, destination)
+
+    async def delete(self, key: str) -> None:
+        try:
+            self.local_path(key).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class S3Storage(StorageBackend):
+    def __init__(self, bucket: str) -> None:
+        self.bucket = bucket
+
+    @property
+    def client(self) -> BaseClient:
+        return _s3_client()
+
+    def url_for(self, key: str) -> str:
+        return f"{S3_SCHEME}{self.bucket}/{key}"
+
+    async def put(self, key: str, source: Path) -> None:
+        def _upload() -> None:
+            from botocore.exceptions import ClientError
+
+            try:
+                self.client.head_object(Bucket=self.bucket, Key=key)
+            except ClientError:
+                # upload_file streams from disk in multipart chunks.
+                self.client.upload_file(str(source), self.bucket, key)
+
+        try:
+            await asyncio.to_thread(_upload)
+        finally:
+            source.unlink(missing_ok=True)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def presigned_url(self, key: str, filename: str, media_type: str) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ResponseContentDisposition": f'attachment; filename="{filename}"',
+                "ResponseContentType": media_type,
+            },
+            ExpiresIn=settings.S3_PRESIGN_EXPIRY_SECONDS,
+        )
+
+
+@lru_cache
+def _s3_client() -> BaseClient:
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.S3_ENDPOINT_URL,
+        region_name=settings.S3_REGION,
+        aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+        # MinIO and moto serve buckets by path rather than by subdomain.
+        config=Config(s3={"addressing_style": "path" if settings.S3_ENDPOINT_URL else "auto"}),
+    )
+
+
+@lru_cache
+def get_storage() -> StorageBackend:
+    """The backend new uploads are written to."""
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(settings.S3_BUCKET)
+    return LocalStorage(settings.UPLOAD_DIR)
+
+
+def resolve(file_url: str) -> tuple[StorageBackend, str]:
+    """Map a stored ``file_url`` back to its backend and key."""
+    if file_url.startswith(LOCAL_SCHEME):
+        return LocalStorage(settings.UPLOAD_DIR), file_url[len(LOCAL_SCHEME) :]
+    if file_url.startswith(S3_SCHEME):
+        bucket, _, key = file_url[len(S3_SCHEME) :].partition("/")
+        return S3Storage(bucket), key
+    path = Path(file_url)
+    return LocalStorage(path.parent), path.name
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.config import get_settings
+from app.models import models  # noqa: F401
+
+config = context.config
+target_metadata = SQLModel.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:  # noqa: ANN001
+    # Monthly archive partitions are created at runtime by the retention job.
+    return not (type_ == "table" and name.startswith("job_postings_archive_"))
+
+
+def _async_url() -> str:
+    return get_settings().DATABASE_URL.replace("postgresql+psycopg", "postgresql+asyncpg")
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=_async_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_with_connection(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def _run_async_migrations() -> None:
+    engine = create_async_engine(_async_url())
+    async with engine.begin() as conn:
+        await conn.run_sync(_run_with_connection)
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    # init_db passes its own connection so migrations share the app engine.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+    else:
+        asyncio.run(_run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
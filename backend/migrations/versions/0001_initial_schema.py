@@ -0,0 +1,116 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("google_sub", sa.String(), nullable=True),
+        sa.Column("google_access_token", sa.String(), nullable=True),
+        sa.Column("google_refresh_token", sa.String(), nullable=True),
+        sa.Column("google_token_expiry", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_google_sub", "users", ["google_sub"], unique=True)
+
+    op.create_table(
+        "resume_files",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("file_url", sa.String(), nullable=False),
+        sa.Column("parsed_text", sa.String(), nullable=False),
+        sa.Column("original_filename", sa.String(), nullable=True),
+    )
+    op.create_index("ix_resume_files_id", "resume_files", ["id"])
+
+    op.create_table(
+        "job_search_history",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("query_parameters", sa.JSON(), nullable=True),
+    )
+    op.create_index("ix_job_search_history_id", "job_search_history", ["id"])
+
+    op.create_table(
+        "job_postings",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("search_id", sa.String(), sa.ForeignKey("job_search_history.id"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("snippet", sa.String(), nullable=True),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("application_link", sa.String(), nullable=True),
+        sa.Column("match_score", sa.Float(), nullable=True),
+        sa.Column("work_mode", sa.String(), nullable=True),
+        sa.Column("experience_level", sa.String(), nullable=True),
+        sa.Column("skills", sa.JSON(), nullable=True),
+        sa.Column("posting_date", sa.DateTime(), nullable=True),
+        sa.Column("company_logo_url", sa.String(), nullable=True),
+    )
+    op.create_index("ix_job_postings_id", "job_postings", ["id"])
+
+    op.create_table(
+        "resume_tailorings",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_id", sa.String(), sa.ForeignKey("job_postings.id"), nullable=False),
+        sa.Column("tailored_resume_text", sa.String(), nullable=False),
+        sa.Column("tailored_coverletter_text", sa.String(), nullable=False),
+        sa.Column("match_score", sa.Float(), nullable=False),
+        sa.Column("saved_to_drive", sa.Boolean(), nullable=False),
+        sa.Column("drive_resume_url", sa.String(), nullable=True),
+        sa.Column("drive_coverletter_url", sa.String(), nullable=True),
+    )
+    op.create_index("ix_resume_tailorings_id", "resume_tailorings", ["id"])
+
+    op.create_table(
+        "application_status",
+        *_timestamps(),
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_id", sa.String(), sa.ForeignKey("job_postings.id"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("applied_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_application_status_id", "application_status", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("application_status")
+    op.drop_table("resume_tailorings")
+    op.drop_table("job_postings")
+    op.drop_table("job_search_history")
+    op.drop_table("resume_files")
+    op.drop_table("users")
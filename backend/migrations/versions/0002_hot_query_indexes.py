@@ -0,0 +1,59 @@
+"""indexes for route queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_resume_files_user_id_created_at", "resume_files", ["user_id", "created_at"])
+    op.create_index("ix_job_search_history_user_id", "job_search_history", ["user_id"])
+    op.create_index("ix_job_postings_search_id", "job_postings", ["search_id"])
+    op.create_index(
+        "ix_resume_tailorings_user_id_job_id_updated_at",
+        "resume_tailorings",
+        ["user_id", "job_id", "updated_at"],
+    )
+    op.create_index("ix_application_status_user_id_updated_at", "application_status", ["user_id", "updated_at"])
+    # The old read-then-insert status endpoint could race into duplicate rows;
+    # keep the most recently updated one per job so the constraint can be added.
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM application_status
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY user_id, job_id ORDER BY updated_at DESC, id DESC
+                    ) AS recency
+                    FROM application_status
+                ) ranked
+                WHERE ranked.recency > 1
+            )
+            """
+        )
+    )
+    op.create_unique_constraint(
+        "uq_application_status_user_id_job_id",
+        "application_status",
+        ["user_id", "job_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_application_status_user_id_job_id", "application_status", type_="unique")
+    op.drop_index("ix_application_status_user_id_updated_at", table_name="application_status")
+    op.drop_index("ix_resume_tailorings_user_id_job_id_updated_at", table_name="resume_tailorings")
+    op.drop_index("ix_job_postings_search_id", table_name="job_postings")
+    op.drop_index("ix_job_search_history_user_id", table_name="job_search_history")
+    op.drop_index("ix_resume_files_user_id_created_at", table_name="resume_files")
@@ -0,0 +1,45 @@
+"""application status event log and per-user series snapshots
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "application_status_events",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_application_status_events_user_id_occurred_at",
+        "application_status_events",
+        ["user_id", "occurred_at"],
+    )
+    op.create_table(
+        "user_status_series",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("daily", sa.JSON(), nullable=False),
+        sa.Column("weekly", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_status_series")
+    op.drop_index("ix_application_status_events_user_id_occurred_at", table_name="application_status_events")
+    op.drop_table("application_status_events")
@@ -0,0 +1,50 @@
+"""partitioned archive for retained job postings
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_postings_archive",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), primary_key=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("search_id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("snippet", sa.String(), nullable=True),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("application_link", sa.String(), nullable=True),
+        sa.Column("match_score", sa.Float(), nullable=True),
+        sa.Column("work_mode", sa.String(), nullable=True),
+        sa.Column("experience_level", sa.String(), nullable=True),
+        sa.Column("skills", sa.JSON(), nullable=True),
+        sa.Column("posting_date", sa.DateTime(), nullable=True),
+        sa.Column("company_logo_url", sa.String(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE TABLE job_postings_archive_default PARTITION OF job_postings_archive DEFAULT")
+    op.create_index("ix_job_postings_created_at", "job_postings", ["created_at"])
+    op.create_index("ix_job_search_history_created_at", "job_search_history", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_search_history_created_at", table_name="job_search_history")
+    op.drop_index("ix_job_postings_created_at", table_name="job_postings")
+    op.drop_table("job_postings_archive")
@@ -0,0 +1,33 @@
+"""content-addressed resume uploads and cached parse results
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resume_files", sa.Column("content_hash", sa.String(), nullable=True))
+    op.create_index("ix_resume_files_content_hash", "resume_files", ["content_hash"])
+    op.create_table(
+        "resume_parse_results",
+        sa.Column("content_hash", sa.String(), primary_key=True),
+        sa.Column("parser_version", sa.String(), primary_key=True),
+        sa.Column("parsed_text", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("resume_parse_results")
+    op.drop_index("ix_resume_files_content_hash", table_name="resume_files")
+    op.drop_column("resume_files", "content_hash")
@@ -0,0 +1,23 @@
+"""section-aware structured index per resume
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("resume_files", sa.Column("structured_index", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("resume_files", "structured_index")
@@ -0,0 +1,43 @@
+"""queued drive export jobs
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("tailoring_id", sa.String(), sa.ForeignKey("resume_tailorings.id"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("save_resume", sa.Boolean(), nullable=False),
+        sa.Column("save_cover_letter", sa.Boolean(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("resume_url", sa.String(), nullable=True),
+        sa.Column("cover_letter_url", sa.String(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_export_jobs_user_id", "export_jobs", ["user_id"])
+    op.create_index("ix_export_jobs_status_created_at", "export_jobs", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_jobs_status_created_at", table_name="export_jobs")
+    op.drop_index("ix_export_jobs_user_id", table_name="export_jobs")
+    op.drop_table("export_jobs")
@@ -0,0 +1,31 @@
+"""bulk drive exports with per-document results
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column("export_jobs", "tailoring_id", existing_type=sa.String(), nullable=True)
+    op.add_column("export_jobs", sa.Column("tailoring_ids", sa.JSON(), nullable=True))
+    op.add_column("export_jobs", sa.Column("folder_id", sa.String(), nullable=True))
+    op.add_column("export_jobs", sa.Column("folder_url", sa.String(), nullable=True))
+    op.add_column("export_jobs", sa.Column("documents", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("export_jobs", "documents")
+    op.drop_column("export_jobs", "folder_url")
+    op.drop_column("export_jobs", "folder_id")
+    op.drop_column("export_jobs", "tailoring_ids")
+    op.alter_column("export_jobs", "tailoring_id", existing_type=sa.String(), nullable=False)
@@ -0,0 +1,35 @@
+"""match scores per resume and posting
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_job_scores",
+        sa.Column("resume_id", sa.String(), sa.ForeignKey("resume_files.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("job_id", sa.String(), sa.ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("prompt_version", sa.String(), nullable=False),
+        sa.Column("resume_digest", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_resume_job_scores_user_id_job_id", "resume_job_scores", ["user_id", "job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_job_scores_user_id_job_id", table_name="resume_job_scores")
+    op.drop_table("resume_job_scores")
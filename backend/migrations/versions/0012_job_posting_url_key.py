@@ -0,0 +1,47 @@
+"""normalized posting URL for match-score lookups
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Optional, Sequence, Union
+from urllib.parse import urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _url_key(url: Optional[str]) -> Optional[str]:
+    # Frozen copy of job_store.posting_url_key as of this revision.
+    parts = urlsplit((url or "").strip())
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def upgrade() -> None:
+    op.add_column("job_postings", sa.Column("url_key", sa.String(), nullable=True))
+    op.create_index("ix_job_postings_url_key", "job_postings", ["url_key"])
+
+    # Lookups match stored scores by their posting's key, so only scored postings need one.
+    bind = op.get_bind()
+    scored = bind.execute(
+        sa.text(
+            "SELECT DISTINCT job_postings.id, job_postings.url FROM job_postings "
+            "JOIN resume_job_scores ON resume_job_scores.job_id = job_postings.id"
+        )
+    ).all()
+    keys = [{"id": posting_id, "url_key": _url_key(url)} for posting_id, url in scored]
+    keys = [row for row in keys if row["url_key"] is not None]
+    if keys:
+        bind.execute(sa.text("UPDATE job_postings SET url_key = :url_key WHERE id = :id"), keys)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_postings_url_key", table_name="job_postings")
+    op.drop_column("job_postings", "url_key")
@@ -0,0 +1,86 @@
+"""Shared fixtures. Database tests run against a disposable Postgres database.
+
+Point ``TEST_DATABASE_URL`` at an empty database; it is migrated to head once
+and truncated after every test. Without it the tests that need it are skipped.
+Benchmarks are marked ``benchmark`` and only run with ``-m benchmark``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import AsyncIterator, Callable, List, Tuple
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    # Settings are read at import time, so this has to happen before ``app`` is imported.
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ.pop("DATABASE_REPLICA_URL", None)
+    os.environ["DB_POOL_WARMUP"] = "0"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    if TEST_DATABASE_URL:
+        return
+    skip = pytest.mark.skip(reason="TEST_DATABASE_URL is not set")
+    for item in items:
+        if "migrated" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def migrated() -> None:
+    from app.db.session import _run_migrations, engine
+
+    async def upgrade() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(_run_migrations)
+        await engine.dispose()
+
+    asyncio.run(upgrade())
+
+
+@pytest.fixture
+async def session(migrated):
+    from sqlalchemy import text
+    from sqlmodel import SQLModel
+
+    from app.db.session import async_session_factory, engine
+
+    async with async_session_factory() as session:
+        yield session
+    tables = ", ".join(table.name for table in SQLModel.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+    # Pooled connections belong to this test's event loop.
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements() -> Callable[[], List[Tuple[str, object]]]:
+    """Record every SQL statement the app sends; call the fixture's value to read them."""
+    from sqlalchemy import event
+
+    from app.db.session import engine
+
+    captured: List[Tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record)
+    yield lambda: list(captured)
+    event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+
+@pytest.fixture
+async def client() -> AsyncIterator:
+    import httpx
+
+    from app.main import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
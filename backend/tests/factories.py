@@ -0,0 +1,111 @@
+"""Seed rows for the integration tests."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.models import (
+    ApplicationStatus,
+    ApplicationStatusEnum,
+    JobPosting,
+    JobSearchHistory,
+    ResumeFile,
+    ResumeTailoring,
+    User,
+)
+
+
+async def seed_user(session: AsyncSession, applications: int, name: str = "Test User") -> User:
+    """A user with one resume, one search and ``applications`` tracked postings, each tailored twice."""
+    user = User(name=name, email=f"{name.lower().replace(' ', '.')}@example.com")
+    session.add(user)
+    await session.flush()
+
+    session.add(ResumeFile(user_id=user.id, file_url="local://resume.pdf", parsed_text="Python developer"))
+    search = JobSearchHistory(user_id=user.id, query_parameters={"keywords": "python"})
+    session.add(search)
+    await session.flush()
+
+    started = datetime.utcnow() - timedelta(days=1)
+    postings: List[JobPosting] = []
+    for index in range(applications):
+        posting = JobPosting(
+            search_id=search.id,
+            title=f"Engineer {index}",
+            company="Acme",
+            location="Remote",
+            description="Build things.",
+            url=f"https://jobs.example.com/{user.id}/{index}",
+            created_at=started + timedelta(minutes=index),
+        )
+        postings.append(posting)
+    session.add_all(postings)
+    await session.flush()
+
+    for index, posting in enumerate(postings):
+        for version in range(2):
+            session.add(
+                ResumeTailoring(
+                    user_id=user.id,
+                    job_id=posting.id,
+                    tailored_resume_text="resume",
+                    tailored_coverletter_text="letter",
+                    drive_resume_url=f"https://drive.example.com/r/{posting.id}/{version}",
+                    updated_at=started + timedelta(minutes=index, seconds=version),
+                )
+            )
+        session.add(
+            ApplicationStatus(
+                user_id=user.id,
+                job_id=posting.id,
+                status=ApplicationStatusEnum.APPLIED,
+                updated_at=started + timedelta(minutes=index),
+            )
+        )
+    await session.commit()
+    return user
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+def minimal_pdf(pages: int, label: str = "Resume", lines_per_page: int = 40) -> bytes:
+    """A text-only PDF with ``pages`` pages of Helvetica lines, written without a PDF library."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # The page tree, filled in once the page objects are numbered.
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids: List[int] = []
+    for page in range(pages):
+        lines = " ".join(
+            f"({label} page {page + 1} line {line}: Python developer with SQL and API experience.) Tj 0 -16 Td"
+            for line in range(lines_per_page)
+        )
+        stream = f"BT /F1 10 Tf 40 760 Td {lines} ET".encode("ascii")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        " ".join(f"{kid} 0 R" for kid in kids).encode("ascii"),
+        pages,
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
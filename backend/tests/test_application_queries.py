@@ -0,0 +1,22 @@
+"""The application listing issues the same number of queries however many applications there are."""
+from __future__ import annotations
+
+from tests.factories import auth_headers, seed_user
+
+
+async def _queries_for_listing(session, client, statements, applications: int) -> int:
+    user = await seed_user(session, applications=applications, name=f"User {applications}")
+    seen = len(statements())
+    response = await client.get("/api/v1/dashboard/applications", headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+    records = response.json()
+    assert len(records) == applications
+    # The newest of the two tailorings per job supplies the Drive link.
+    assert all(record["tailored_resume_url"].endswith("/1") for record in records)
+    return len(statements()) - seen
+
+
+async def test_listing_query_count_is_constant(session, client, statements):
+    assert await _queries_for_listing(session, client, statements, 1) == await _queries_for_listing(
+        session, client, statements, 50
+    )
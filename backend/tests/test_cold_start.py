@@ -0,0 +1,16 @@
+"""Importing the app stays cheap: heavy service dependencies load on first use."""
+from __future__ import annotations
+
+from app.cli import import_times
+
+LAZY_PACKAGES = {"docx", "google_auth_oauthlib", "googleapiclient", "langchain", "langchain_community", "pypdf"}
+# Generous enough for a cold interpreter on a loaded CI runner.
+MAX_IMPORT_SECONDS = 3.0
+
+
+def test_app_import_skips_heavy_dependencies():
+    times = import_times("app.main")
+
+    eager = sorted(name for name in times if name.split(".")[0] in LAZY_PACKAGES)
+    assert eager == []
+    assert sum(times.values()) / 1_000_000 < MAX_IMPORT_SECONDS
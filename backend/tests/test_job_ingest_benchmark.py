@@ -0,0 +1,60 @@
+"""Bulk posting ingest against one INSERT per row."""
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.models.models import JobPosting, JobSearchHistory, User
+from app.services.job_store import _posting_row, insert_job_postings
+
+pytestmark = pytest.mark.benchmark
+
+POSTINGS = 500
+
+
+def _jobs(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Engineer {index}",
+            "company": "Acme",
+            "location": "Remote",
+            "description": "Build things. " * 40,
+            "url": f"https://jobs.example.com/{index}",
+            "match_score": None,
+            "skills": ["python", "sql"],
+        }
+        for index in range(count)
+    ]
+
+
+async def _search(session) -> str:
+    user = User(name="Bench", email="bench@example.com")
+    session.add(user)
+    await session.flush()
+    search = JobSearchHistory(user_id=user.id, query_parameters={})
+    session.add(search)
+    await session.commit()
+    return search.id
+
+
+async def test_bulk_insert_beats_per_row_insert(session):
+    search_id = await _search(session)
+    jobs = _jobs(POSTINGS)
+
+    started = time.perf_counter()
+    for job in jobs:
+        await session.execute(insert(JobPosting.__table__).values(_posting_row(search_id, job)))
+    await session.commit()
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rows = await insert_job_postings(session, search_id, jobs)
+    await session.commit()
+    bulk = time.perf_counter() - started
+
+    assert len(rows) == POSTINGS
+    assert await session.scalar(select(func.count()).select_from(JobPosting)) == 2 * POSTINGS
+    print(f"\n{POSTINGS} postings: per-row {per_row * 1000:.0f} ms, bulk {bulk * 1000:.0f} ms")
+    assert bulk < per_row
@@ -0,0 +1,67 @@
+"""Event-loop lag while resume uploads are parsed alongside dashboard reads."""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from app.services.parse_pool import shutdown_parse_pool
+from tests.factories import auth_headers, minimal_pdf, seed_user
+
+pytestmark = pytest.mark.benchmark
+
+UPLOADS = 8
+READS = 40
+PAGES = 30
+# The loop should only ever wait on I/O; a blocking parse shows up as lag of seconds.
+MAX_LAG_SECONDS = 0.1
+
+
+async def _probe_lag(stop: asyncio.Event, lags: list[float], interval: float = 0.01) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def test_uploads_do_not_block_dashboard_reads(session, client):
+    user = await seed_user(session, applications=20)
+    headers = auth_headers(user)
+    # Distinct bytes per upload, so none is served from the parse cache.
+    files = [minimal_pdf(PAGES, label=f"Upload {index}") for index in range(UPLOADS)]
+
+    async def upload(content: bytes) -> int:
+        response = await client.post(
+            "/api/v1/resumes/upload", headers=headers, files={"file": ("resume.pdf", content, "application/pdf")}
+        )
+        return response.status_code
+
+    async def read() -> float:
+        started = time.perf_counter()
+        response = await client.get("/api/v1/dashboard/applications", headers=headers)
+        assert response.status_code == 200, response.text
+        return time.perf_counter() - started
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe_lag(stop, lags))
+    try:
+        statuses, reads = await asyncio.gather(
+            asyncio.gather(*(upload(content) for content in files)),
+            asyncio.gather(*(read() for _ in range(READS))),
+        )
+    finally:
+        stop.set()
+        await probe
+        shutdown_parse_pool()
+
+    assert set(statuses) <= {200, 503}, statuses
+    assert 200 in statuses
+    print(
+        f"\n{UPLOADS} uploads x {PAGES} pages with {READS} reads: loop lag median "
+        f"{statistics.median(lags) * 1000:.1f} ms, max {max(lags) * 1000:.1f} ms; "
+        f"read median {statistics.median(reads) * 1000:.0f} ms"
+    )
+    assert max(lags) < MAX_LAG_SECONDS
@@ -0,0 +1,59 @@
+"""A parse that times out gets its worker killed, and other queued calls still finish."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import parse_pool
+from app.services.parse_pool import ResumeParseError
+
+
+def _hang(*args: object) -> str:
+    time.sleep(3600)
+    return ""
+
+
+def _double(value: int) -> int:
+    return value * 2
+
+
+@pytest.fixture
+def single_worker(monkeypatch):
+    parse_pool.shutdown_parse_pool()
+    monkeypatch.setattr(parse_pool.settings, "PARSER_MAX_WORKERS", 1)
+    monkeypatch.setattr(parse_pool.settings, "PARSER_TIMEOUT_SECONDS", 1.0)
+    monkeypatch.setattr(parse_pool, "_slots", None)
+    yield
+    parse_pool.shutdown_parse_pool()
+
+
+async def test_timeout_kills_worker_and_resubmits_queued_calls(single_worker, monkeypatch, tmp_path):
+    monkeypatch.setattr(parse_pool, "extract_text", _hang)
+    path = tmp_path / "resume.txt"
+    path.write_text("Python developer")
+
+    parse = asyncio.ensure_future(parse_pool.parse_resume(path))
+    await asyncio.sleep(0.1)
+    # Queued behind the hanging parse in the only worker.
+    doubled = asyncio.ensure_future(parse_pool.run_in_worker(_double, 21))
+
+    with pytest.raises(ResumeParseError):
+        await parse
+    assert parse_pool.metrics.timeouts >= 1
+    assert await asyncio.wait_for(doubled, timeout=30) == 42
+
+
+async def test_queue_wait_is_capped(single_worker, monkeypatch, tmp_path):
+    monkeypatch.setattr(parse_pool.settings, "PARSER_MAX_QUEUE_WAIT_SECONDS", 0.2)
+    path = tmp_path / "resume.txt"
+    path.write_text("Python developer")
+
+    slots = parse_pool._get_slots()
+    await slots.acquire()
+    try:
+        with pytest.raises(parse_pool.ParserBusyError):
+            await parse_pool.parse_resume(path)
+    finally:
+        slots.release()
@@ -0,0 +1,46 @@
+"""Wall time per page and peak memory of chunked PDF extraction on synthetic documents."""
+from __future__ import annotations
+
+import resource
+import time
+
+import pytest
+
+from app.services import parse_pool
+from tests.factories import minimal_pdf
+
+pytestmark = pytest.mark.benchmark
+
+PAGE_COUNTS = (5, 20, 50)
+
+
+async def test_chunked_pdf_extraction(monkeypatch, tmp_path):
+    monkeypatch.setattr(parse_pool, "_slots", None)
+    parse_pool.shutdown_parse_pool()
+    timings = {}
+    warmup = tmp_path / "warmup.pdf"
+    warmup.write_bytes(minimal_pdf(1))
+    try:
+        # Spawning the workers is not part of the per-page cost.
+        await parse_pool.parse_resume(warmup)
+        for pages in PAGE_COUNTS:
+            path = tmp_path / f"resume-{pages}.pdf"
+            path.write_bytes(minimal_pdf(pages, label=f"Resume {pages}"))
+
+            started = time.perf_counter()
+            text = await parse_pool.parse_resume(path)
+            timings[pages] = (time.perf_counter() - started) / pages
+
+            assert f"Resume {pages} page {pages} line 0" in text
+    finally:
+        # Children only show up in RUSAGE_CHILDREN once they have exited.
+        parse_pool.shutdown_parse_pool(wait=True)
+
+    worker_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    main_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print()
+    for pages, per_page in timings.items():
+        print(f"{pages:>3} pages: {per_page * 1000:.1f} ms/page")
+    print(f"Peak RSS: main {main_kb / 1024:.0f} MB, largest worker {worker_kb / 1024:.0f} MB")
+    # Pages are extracted in bounded chunks, so the per-page cost must not grow with the document.
+    assert timings[PAGE_COUNTS[-1]] < timings[PAGE_COUNTS[0]] * 2
@@ -0,0 +1,66 @@
+"""Every read route's queries must be answerable from an index.
+
+Seqscans are disabled for the EXPLAIN, so a ``Seq Scan`` left in a plan means
+no usable index exists for it, whatever the table size.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterator
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import engine
+from tests.factories import auth_headers, seed_user
+
+LARGE_TABLES = {
+    "application_status",
+    "job_postings",
+    "job_search_history",
+    "resume_files",
+    "resume_tailorings",
+}
+
+
+def _plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/resumes/",
+        "/api/v1/jobs/",
+        "/api/v1/jobs/{job_id}",
+        "/api/v1/dashboard/applications",
+        "/api/v1/dashboard/summary",
+    ],
+)
+async def test_read_routes_use_indexes(session, client, statements, path):
+    user = await seed_user(session, applications=50)
+    await seed_user(session, applications=50, name="Other User")
+    job_id = (await session.execute(text("SELECT job_id FROM application_status LIMIT 1"))).scalar_one()
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    seen = len(statements())
+    response = await client.get(path.format(job_id=job_id), headers=auth_headers(user))
+    assert response.status_code == 200, response.text
+
+    selects = [(sql, params) for sql, params in statements()[seen:] if sql.lstrip().upper().startswith(("SELECT", "WITH"))]
+    assert selects
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        for sql, params in selects:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            raw = result.scalar_one()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+            scanned = {
+                node["Relation Name"]
+                for node in _plan_nodes(plan)
+                if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES
+            }
+            assert not scanned, f"sequential scan on {sorted(scanned)} for:\n{sql}"
@@ -0,0 +1,35 @@
+"""Backfilled creation events balance transitions logged after the deploy."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+
+from app.models.models import ApplicationStatus, ApplicationStatusEvent, UserStatusSeries
+from app.services.status_history import backfill_status_events
+from tests.factories import seed_user
+
+
+async def test_backfill_seeds_creation_before_logged_change(session):
+    user = await seed_user(session, applications=2)
+    applications = (await session.execute(select(ApplicationStatus))).scalars().all()
+    changed = applications[0]
+    # Tracked before the log existed, then moved on after the deploy.
+    changed.status = "Offer"
+    session.add(
+        ApplicationStatusEvent(
+            user_id=user.id,
+            job_id=changed.job_id,
+            from_status="Applied",
+            to_status="Offer",
+            occurred_at=datetime.utcnow() - timedelta(hours=1),
+        )
+    )
+    await session.commit()
+
+    assert await backfill_status_events(session) == 2
+    assert await backfill_status_events(session) == 0
+
+    series = await session.get(UserStatusSeries, user.id, populate_existing=True)
+    latest = {status: values[-1] for status, values in series.daily["columns"].items()}
+    assert latest == {"Applied": 1, "Offer": 1}
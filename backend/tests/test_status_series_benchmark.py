@@ -0,0 +1,82 @@
+"""Folding 10k status events: full rebuild, incremental fold and the summary read."""
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.models import ApplicationStatusEvent
+from app.services.status_history import DAY_FORMAT, WEEK_FORMAT, _fold, rebuild_series
+from tests.factories import auth_headers, seed_user
+
+pytestmark = pytest.mark.benchmark
+
+EVENTS = 10_000
+STATUSES = ["Applied", "Interview", "Offer", "Rejected"]
+
+
+def _events(user_id: str, count: int) -> list[ApplicationStatusEvent]:
+    """One creation then one move per job, spread over the past year in time order."""
+    started = datetime.utcnow() - timedelta(days=365)
+    step = timedelta(days=365) / count
+    events = []
+    for index in range(count):
+        job, moved = divmod(index, 2)
+        events.append(
+            ApplicationStatusEvent(
+                user_id=user_id,
+                job_id=f"job-{job}",
+                from_status=STATUSES[job % 2] if moved else None,
+                to_status=STATUSES[2 + job % 2] if moved else STATUSES[job % 2],
+                occurred_at=started + step * index,
+            )
+        )
+    return events
+
+
+def test_incremental_fold_beats_full_rebuild():
+    events = _events("bench", EVENTS)
+    *history, latest = events
+
+    started = time.perf_counter()
+    full = _fold({}, events, DAY_FORMAT)
+    full_ms = (time.perf_counter() - started) * 1000
+
+    snapshot = _fold({}, history, DAY_FORMAT)
+    started = time.perf_counter()
+    incremental = _fold(snapshot, [latest], DAY_FORMAT)
+    incremental_ms = (time.perf_counter() - started) * 1000
+
+    assert incremental == full
+    assert sum(values[-1] for values in full["columns"].values()) == EVENTS // 2
+    weekly = _fold({}, events, WEEK_FORMAT)
+    print(
+        f"\n{EVENTS} events: full fold {full_ms:.1f} ms ({len(full['labels'])} days, "
+        f"{len(weekly['labels'])} weeks), incremental {incremental_ms:.2f} ms"
+    )
+    assert incremental_ms < full_ms
+
+
+async def test_summary_latency_with_10k_events(session, client):
+    user = await seed_user(session, applications=0)
+    session.add_all(_events(user.id, EVENTS))
+    await session.flush()
+    started = time.perf_counter()
+    await rebuild_series(session, user.id)
+    await session.commit()
+    rebuild_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for _ in range(20):
+        started = time.perf_counter()
+        response = await client.get("/api/v1/dashboard/summary", headers=auth_headers(user))
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.text
+    points = response.json()["status_over_time"]
+
+    assert points and sum(points[-1][status] for status in STATUSES) == EVENTS // 2
+    print(f"\nrebuild {rebuild_ms:.0f} ms, summary median {statistics.median(timings):.1f} ms")
+    # The summary reads the precomputed snapshot, so it must not scale with the log.
+    assert statistics.median(timings) < rebuild_ms
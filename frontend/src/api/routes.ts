@@ -1,6 +1,7 @@
 import type {
   ApplicationRecord,
   DashboardSummary,
+  ExportJob,
   JobPosting,
   JobScoreResponse,
   JobSearchQuery,
@@ -19,7 +20,9 @@ export const resumeApi = {
     return data
   },
   list: async (): Promise<ResumeFile[]> => {
-    const { data } = await apiClient.get<ResumeFile[]>('/resumes')
+    const { data } = await apiClient.get<ResumeFile[]>('/resumes', {
+      params: { fields: 'resume_id,file_url,uploaded_at,original_filename' },
+    })
     return data
   },
   remove: async (resumeId: string): Promise<void> => {
@@ -32,8 +35,10 @@ export const jobApi = {
     const { data } = await apiClient.post<JobPosting[]>('/jobs/search', payload)
     return data
   },
-  detail: async (jobId: string): Promise<JobPosting> => {
-    const { data } = await apiClient.get<JobPosting>(`/jobs/${jobId}`)
+  detail: async (jobId: string, resumeId?: string | null): Promise<JobPosting> => {
+    const { data } = await apiClient.get<JobPosting>(`/jobs/${jobId}`, {
+      params: resumeId ? { resume_id: resumeId } : undefined,
+    })
     return data
   },
   score: async (jobId: string, resumeId: string): Promise<JobScoreResponse> => {
@@ -42,18 +47,35 @@ export const jobApi = {
   },
 }
 
+// Exports run in the background; long-poll until the job settles.
+const waitForExport = async (job: ExportJob): Promise<ExportJob> => {
+  let current = job
+  while (current.status === 'queued' || current.status === 'running') {
+    const { data } = await apiClient.get<ExportJob>(`/tailoring/exports/${current.job_id}`, { params: { wait: 25 } })
+    current = data
+  }
+  if (current.status === 'failed') {
+    throw new Error(current.error || 'Drive export failed.')
+  }
+  return current
+}
+
 export const tailoringApi = {
   create: async (payload: { job_id: string; resume_id?: string | null; instructions?: string }): Promise<TailoringResponse> => {
     const { data } = await apiClient.post<TailoringResponse>('/tailoring', payload)
     return data
   },
-  action: async (payload: { tailoring_id: string; action: 'regenerate' | 'improve' | 'shorten' | 'professional' | 'match_jd'; editor: 'resume' | 'cover_letter'; user_edits?: string }) => {
+  action: async (payload: { tailoring_id: string; action: 'regenerate' | 'improve' | 'shorten' | 'professional' | 'match_jd'; editor: 'resume' | 'cover_letter'; user_edits?: string; section?: string }) => {
     const { data } = await apiClient.post<{ updated_text: string }>('/tailoring/actions', payload)
     return data
   },
   saveToDrive: async (payload: { tailoring_id: string; save_resume?: boolean; save_cover_letter?: boolean }) => {
-    const { data } = await apiClient.post<{ resume_url?: string; cover_letter_url?: string }>('/tailoring/save', payload)
-    return data
+    const { data } = await apiClient.post<ExportJob>('/tailoring/save', payload)
+    return waitForExport(data)
+  },
+  bulkSaveToDrive: async (payload: { tailoring_ids: string[]; save_resume?: boolean; save_cover_letter?: boolean }) => {
+    const { data } = await apiClient.post<ExportJob>('/tailoring/save/bulk', payload)
+    return waitForExport(data)
   },
 }
 
@@ -63,8 +85,16 @@ export const dashboardApi = {
     return data
   },
   applications: async (): Promise<ApplicationRecord[]> => {
-    const { data } = await apiClient.get<ApplicationRecord[]>('/dashboard/applications')
-    return data
+    const records: ApplicationRecord[] = []
+    let cursor: string | undefined
+    do {
+      const { data, headers } = await apiClient.get<ApplicationRecord[]>('/dashboard/applications', {
+        params: { limit: 200, cursor },
+      })
+      records.push(...data)
+      cursor = headers['x-next-cursor'] || undefined
+    } while (cursor)
+    return records
   },
   updateStatus: async (payload: { job_id: string; status: ApplicationRecord['status']; notes?: string; applied_at?: string }) => {
     const { data } = await apiClient.post<ApplicationRecord>('/dashboard/applications/status', payload)
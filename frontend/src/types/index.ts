@@ -9,7 +9,7 @@ export interface UserProfile {
 export interface ResumeFile {
   resume_id: string
   file_url: string
-  parsed_text: string
+  parsed_text?: string
   uploaded_at: string
   original_filename?: string | null
 }
@@ -66,6 +66,28 @@ export interface TailoringRecord extends TailoringResponse {
   drive_coverletter_url?: string | null
 }
 
+export interface ExportDocumentResult {
+  tailoring_id: string
+  kind?: 'resume' | 'cover_letter' | null
+  url?: string | null
+  error?: string | null
+}
+
+export interface ExportJob {
+  job_id: string
+  tailoring_id?: string | null
+  tailoring_ids?: string[] | null
+  status: 'queued' | 'running' | 'succeeded' | 'failed'
+  attempts: number
+  error?: string | null
+  resume_url?: string
+  cover_letter_url?: string
+  folder_url?: string | null
+  documents: ExportDocumentResult[]
+  created_at: string
+  finished_at?: string | null
+}
+
 export interface ApplicationRecord {
   job_id: string
   job_title: string
@@ -86,4 +108,5 @@ export interface DashboardSummary {
   rejections: number
   weekly_applications: Array<{ week: string; count: number }>
   status_over_time: Array<Record<string, number | string>>
+  status_over_time_weekly?: Array<Record<string, number | string>>
 }